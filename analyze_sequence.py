@@ -4,17 +4,191 @@ HW3 Part 4: Sequence Analysis Tool
 Bring it all together! Use the functions you wrote to analyze protein sequences.
 """
 
+import argparse
+import gzip
+import os
 import sys
-from read_fasta import read_fasta
+from collections import deque
+from collections.abc import Sized
+from contextlib import closing, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from read_fasta import iter_fasta, iter_fasta_range, fasta_byte_ranges
+from compressed_io import detect_compression
+from fasta_index import FastaIndex
+from motif_search import MotifSet
+from result_cache import ResultCache, DEFAULT_MAX_ENTRIES
+from columnar_results import FORMATS, FILE_EXTENSIONS, write_columnar_results
+from progress import ProgressReporter
+from instrumentation import Instrumentation
 import sequence_utils
 
+# Residues per work unit sent to a worker process; large enough that
+# process overhead is negligible, small enough to balance load.
+CHUNK_RESIDUES = 1_000_000
+# Work units per worker for file-range sharding and chunking, so uneven
+# units even out.
+RANGES_PER_WORKER = 4
+# Largest byte range parsed by one worker; a range's results are returned
+# in one piece, so this bounds the memory of each work unit.
+MAX_RANGE_BYTES = 16 << 20
+# Characters of formatted text report buffered between writes
+WRITE_BUFFER_SIZE = 1 << 20
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
 
-def analyze_sequences(sequences):
+
+def _analyze_records(records, motif_set=None):
+    """Compute metrics, plus motif hits if requested, for (header, sequence) pairs."""
+    records = list(records)
+    # One bincount over the whole chunk feeds every metric of every record
+    results = sequence_utils.sequence_metrics_many([sequence for _, sequence in records])
+    if motif_set is not None:
+        for (_, sequence), metrics in zip(records, results):
+            metrics['motifs'] = motif_set.search(sequence)
+    return [(header, metrics) for (header, _), metrics in zip(records, results)]
+
+
+def _analyze_byte_range(filename, start, end, motif_set=None):
+    """Worker entry point: parse and analyze one byte range of a FASTA file."""
+    return _analyze_records(iter_fasta_range(filename, start, end), motif_set)
+
+
+def _analyze_with_cache(records, motif_set, cache, workers):
+    """
+    Yield (header, metrics), reusing cached results where possible.
+
+    Records are handled in chunks: cached results are fetched in one
+    query, each distinct uncached sequence is computed once (optionally on
+    a process pool) and the new results are written back.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for chunk in _chunk_records(records):
+            keys = [cache.key(sequence, motif_set) for _, sequence in chunk]
+            known = cache.get_many(keys)
+
+            todo = {}
+            for (_, sequence), key in zip(chunk, keys):
+                if key not in known:
+                    todo.setdefault(key, sequence)  # duplicates are computed once
+
+            if pool is not None and len(todo) > 1:
+                items = list(todo.items())
+                parts = [items[i::workers] for i in range(workers)]
+                computed = {}
+                for part in pool.map(_analyze_records, parts, [motif_set] * workers):
+                    computed.update(part)
+            else:
+                computed = dict(_analyze_records(todo.items(), motif_set))
+
+            cache.put_many(computed)
+            known.update(computed)
+            for (header, _), key in zip(chunk, keys):
+                yield header, known[key]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def _as_motif_set(motifs):
+    if motifs is None or isinstance(motifs, MotifSet):
+        return motifs
+    return MotifSet(motifs)
+
+
+def _chunk_records(records, chunk_residues=CHUNK_RESIDUES):
+    """Group (header, sequence) pairs into lists of about chunk_residues residues."""
+    chunk = []
+    size = 0
+    for header, sequence in records:
+        chunk.append((header, sequence))
+        size += len(sequence)
+        if size >= chunk_residues:
+            yield chunk
+            chunk = []
+            size = 0
+    if chunk:
+        yield chunk
+
+
+def _chunk_residues(total, workers):
+    """
+    Residues per work unit for `workers` processes.
+
+    Uses CHUNK_RESIDUES, or less when total (an estimate of the residues to
+    analyze) would otherwise give some workers nothing to do.
+    """
+    if not total:
+        return CHUNK_RESIDUES
+    return max(1, min(CHUNK_RESIDUES, total // (RANGES_PER_WORKER * workers)))
+
+
+def _ordered_pool_map(func, work, workers, on_done=None):
+    """
+    Run func(*args) for each args tuple in a process pool.
+
+    Results are yielded in submission order, and at most two work units
+    per worker are in flight so memory stays bounded for long inputs.
+    If given, on_done(args) is called as each work unit's results are
+    yielded.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+
+        def finish_oldest():
+            args, future = pending.popleft()
+            yield from future.result()
+            if on_done is not None:
+                on_done(args)
+
+        for args in work:
+            pending.append((args, pool.submit(func, *args)))
+            if len(pending) >= 2 * workers:
+                yield from finish_oldest()
+        while pending:
+            yield from finish_oldest()
+
+
+def _analyze_on_pool(records, motif_set, workers, chunk_residues):
+    """Analyze records on a process pool in chunks of about chunk_residues residues."""
+    work = ((chunk, motif_set) for chunk in _chunk_records(records, chunk_residues))
+    return _ordered_pool_map(_analyze_records, work, workers)
+
+
+def iter_analyze_sequences(sequences, workers=1, motifs=None, cache=None):
+    """
+    Analyze protein sequences lazily, yielding results in input order.
+
+    Takes the same arguments as analyze_sequences(); use this form to
+    stream results (e.g. into write_results()) without collecting them.
+
+    Yields:
+        tuple: (header, metrics)
+    """
+    records = sequences.items() if hasattr(sequences, 'items') else sequences
+    motif_set = _as_motif_set(motifs)
+
+    if cache is not None:
+        return _analyze_with_cache(records, motif_set, cache, workers)
+    if workers > 1:
+        total = sum(len(sequence) for _, sequence in records) if isinstance(records, Sized) else None
+        return _analyze_on_pool(records, motif_set, workers, _chunk_residues(total, workers))
+    return (result for chunk in _chunk_records(records) for result in _analyze_records(chunk, motif_set))
+
+
+def analyze_sequences(sequences, workers=1, motifs=None, cache=None):
     """
     Analyze protein sequences and return a dictionary of results.
 
     Args:
-        sequences (dict): Dictionary of header -> sequence
+        sequences (dict or iterable): Dictionary of header -> sequence, or any
+            iterable of (header, sequence) pairs such as iter_fasta()
+        workers (int): Number of worker processes; records are sent to the
+            workers in chunks of about CHUNK_RESIDUES residues, or smaller
+            chunks when a dict is too small to keep every worker busy
+        motifs (iterable or MotifSet): Optional motifs to search for; hits are
+            added to each result under 'motifs' as motif -> positions
+        cache (ResultCache): Optional on-disk cache consulted before and
+            populated after computing each distinct sequence
 
     Returns:
         dict: Dictionary mapping headers to analysis results
@@ -38,67 +212,234 @@ def analyze_sequences(sequences):
     #     'negative_charge': ...
     # }
 
-    for header, sequence in sequences.items():
-        # TODO: Implement analysis for each sequence
-        length = len(sequence)
-        mol_weight = sequence_utils.molecular_weight(sequence)
-        hydrophobic_count = sequence_utils.count_hydrophobic(sequence)
-        positive_count, negative_count = sequence_utils.count_charged_residues(sequence)
-
-        results[header] = {
-            'length': length,
-            'molecular_weight': mol_weight,
-            'hydrophobic_count': hydrophobic_count,
-            'positive_charge': positive_count,
-            'negative_charge': negative_count
-        }
+    for header, metrics in iter_analyze_sequences(sequences, workers, motifs, cache):
+        results[header] = metrics
+
+    return results
+
+
+def _record_size(record):
+    header, sequence = record
+    return len(header) + len(sequence)
+
+
+def iter_analyze_fasta(filename, workers=1, motifs=None, cache=None, progress=None,
+                       instrumentation=None):
+    """
+    Analyze every record of a FASTA file lazily, in file order.
+
+    Takes the same arguments as analyze_fasta(), plus an optional
+    ProgressReporter that is told how many input bytes have been read and
+    an optional Instrumentation that times the "parse" and "analyze"
+    stages (parsing is part of "analyze" when workers read the file).
+
+    Yields:
+        tuple: (header, metrics)
+    """
+    instrumentation = instrumentation or Instrumentation()
+    # Compressed files cannot be split into byte ranges, so they are
+    # decompressed here and the records are sent to the workers in chunks.
+    motif_set = _as_motif_set(motifs)
+    if workers <= 1 or cache is not None or detect_compression(filename) is not None:
+        records = instrumentation.wrap_iter("parse", iter_fasta(filename, progress), _record_size)
+        if workers > 1 and cache is None:
+            # The compressed size underestimates the residues, which errs
+            # towards smaller chunks
+            chunk_residues = _chunk_residues(os.path.getsize(filename), workers)
+            analyzed = _analyze_on_pool(records, motif_set, workers, chunk_residues)
+        else:
+            analyzed = iter_analyze_sequences(records, workers=workers, motifs=motif_set, cache=cache)
+        return instrumentation.wrap_iter("analyze", analyzed)
+
+    ranges = fasta_byte_ranges(filename, workers * RANGES_PER_WORKER, MAX_RANGE_BYTES)
+    work = ((filename, start, end, motif_set) for start, end in ranges)
+    on_done = None
+    if progress is not None:
+        def on_done(args):
+            progress.add_bytes(args[2] - args[1])
+    analyzed = _ordered_pool_map(_analyze_byte_range, work, workers, on_done)
+    return instrumentation.wrap_iter("analyze", analyzed)
+
 
+def analyze_fasta(filename, workers=1, motifs=None, cache=None):
+    """
+    Analyze every record of a FASTA file.
+
+    With several workers the file is split into byte ranges on record
+    boundaries and each worker parses its own ranges, so sequences are
+    never pickled between processes. Results keep the file order.
+    Compressed files (gzip, bgzip, zstd) are decompressed in this process.
+
+    Args:
+        filename (str): Path to FASTA file
+        workers (int): Number of worker processes
+        motifs (iterable or MotifSet): Optional motifs, as analyze_sequences()
+        cache (ResultCache): Optional result cache, as analyze_sequences();
+            cache lookups happen in this process, so the file is read here
+
+    Returns:
+        dict: Dictionary mapping headers to analysis results
+    """
+    results = {}
+    for header, metrics in iter_analyze_fasta(filename, workers, motifs, cache):
+        results[header] = metrics
     return results
 
 
-def write_results(results, output_file="analysis_results.txt"):
+def _format_result(header, metrics):
+    """Format one sequence's results as a block of the text report."""
+    net_charge = metrics['positive_charge'] - metrics['negative_charge']
+
+    # Example format:
+    # Sequence: protein_name
+    #   Length: 150 aa
+    #   Molecular Weight: 16543.21 Da
+    #   Hydrophobic residues: 45
+    #   Positive charges: 12
+    #   Negative charges: 15
+    #   Net charge: -3
+    #
+    block = (f"Sequence: {header}\n"
+             f"  Length: {metrics['length']} aa\n"
+             f"  Molecular Weight: {metrics['molecular_weight']:.2f} Da\n"
+             f"  Hydrophobic residues: {metrics['hydrophobic_count']}\n"
+             f"  Positive charges: {metrics['positive_charge']}\n"
+             f"  Negative charges: {metrics['negative_charge']}\n"
+             f"  Net charge: {net_charge}\n")
+    for motif, positions in metrics.get('motifs', {}).items():
+        block += f"  Motif {motif}: {len(positions)} hit(s) at {positions}\n"
+    return block + "\n"
+
+
+def _open_output(output_file, compression=None):
+    """
+    Open a text output file, compressing on the fly if requested.
+
+    Compression is inferred from a .gz or .zst extension when not given.
+    """
+    if compression is None:
+        compression = COMPRESSION_EXTENSIONS.get(os.path.splitext(output_file)[1])
+    if compression == "gzip":
+        return gzip.open(output_file, 'wt')
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd output requires the zstandard package") from None
+        return zstandard.open(output_file, 'wt')
+    if compression is not None:
+        raise ValueError(f"Unknown compression: {compression!r} (expected gzip or zstd)")
+    return open(output_file, 'w')
+
+
+def _replace_output(write, results, output_file):
+    """
+    Write results to a temporary file and move it over output_file on success.
+
+    A failure leaves any existing output_file untouched. Errors raised while
+    producing the results (parsing or analysis) propagate to the caller;
+    errors while writing are reported here.
+
+    Args:
+        write (callable): write(items, path) that writes the items to path
+        results (dict or iterable): Results dictionary or (header, metrics) pairs
+        output_file (str): Final output filename
+
+    Returns:
+        bool: True if output_file was written, False if writing failed
+    """
+    items = results.items() if hasattr(results, 'items') else results
+    source_errors = []
+
+    def tracked():
+        try:
+            yield from items
+        except Exception as e:
+            source_errors.append(e)
+            raise
+
+    # Keep the extension, which selects the compression and np.savez honours
+    root, extension = os.path.splitext(output_file)
+    temp_file = f"{root}.tmp{os.getpid()}{extension}"
+    try:
+        write(tracked(), temp_file)
+        if os.path.exists(temp_file):
+            os.replace(temp_file, output_file)
+    except Exception as e:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        if source_errors:
+            raise
+        print(f"Error writing results to {output_file}: {e}")
+        return False
+
+    print(f"\nResults written to {output_file}")
+    return True
+
+
+def write_results(results, output_file="analysis_results.txt", compression=None):
     """
     Write analysis results to a file.
 
+    Records are formatted into an in-memory buffer that is written out in
+    blocks of about WRITE_BUFFER_SIZE characters, so results can be streamed
+    from an iterator with constant memory and few write calls. The report
+    goes to a temporary file that replaces output_file only once complete,
+    so a failed run never leaves a truncated report behind.
+
     Args:
-        results (dict): Results dictionary from analyze_sequences()
+        results (dict or iterable): Results dictionary from analyze_sequences(),
+            or any iterable of (header, metrics) pairs
         output_file (str): Output filename
+        compression (str): "gzip" or "zstd" to compress the output; inferred
+            from a .gz or .zst extension when None
+
+    Returns:
+        bool: True if the report was written, False if writing failed (the
+            error is printed)
+
+    Raises:
+        Exception: Any error raised while iterating over results
     """
-    # TODO: Write results to a file
-    # Format the output nicely so it's easy to read
-    # Include all the analysis metrics
+    if compression is None:
+        compression = COMPRESSION_EXTENSIONS.get(os.path.splitext(output_file)[1])
 
-    try:
-        with open(output_file, 'w') as f:
-            f.write("Protein Sequence Analysis Results\n")
-            f.write("=" * 70 + "\n\n")
-
-            # TODO: Write each sequence's results
-            # Example format:
-            # Sequence: protein_name
-            #   Length: 150 aa
-            #   Molecular Weight: 16543.21 Da
-            #   Hydrophobic residues: 45
-            #   Positive charges: 12
-            #   Negative charges: 15
-            #   Net charge: -3
-            #
-            for header, metrics in results.items():
-                net_charge = metrics['positive_charge'] - metrics['negative_charge']
-
-                f.write(f"Sequence: {header}\n")
-                f.write(f"  Length: {metrics['length']} aa\n")
-                f.write(f"  Molecular Weight: {metrics['molecular_weight']:.2f} Da\n")
-                f.write(f"  Hydrophobic residues: {metrics['hydrophobic_count']}\n")
-                f.write(f"  Positive charges: {metrics['positive_charge']}\n")
-                f.write(f"  Negative charges: {metrics['negative_charge']}\n")
-                f.write(f"  Net charge: {net_charge}\n")
-                f.write("\n")
-
-        print(f"\nResults written to {output_file}")
+    def write(items, path):
+        with _open_output(path, compression) as f:
+            buffer = ["Protein Sequence Analysis Results\n", "=" * 70 + "\n\n"]
+            buffered = 0
+            for header, metrics in items:
+                block = _format_result(header, metrics)
+                buffer.append(block)
+                buffered += len(block)
+                if buffered >= WRITE_BUFFER_SIZE:
+                    f.write("".join(buffer))
+                    buffer = []
+                    buffered = 0
+            f.write("".join(buffer))
 
-    except Exception as e:
-        print(f"Error writing results: {e}")
+    return _replace_output(write, results, output_file)
+
+
+def _write_output(results, fmt, output_file=None):
+    """Write results as the text report or in a columnar format; returns success."""
+    if fmt == "text":
+        return write_results(results, output_file or "analysis_results.txt")
+    output_file = output_file or "analysis_results" + FILE_EXTENSIONS[fmt]
+    return _replace_output(lambda items, path: write_columnar_results(items, path, fmt),
+                    results, output_file)
+
+
+def _print_totals(count, residues):
+    mean_length = residues / count if count else 0.0
+    print(f"Totals: {count} sequence(s), {residues:,} residues, mean length {mean_length:.1f} aa")
+
+
+def _print_result(header, metrics):
+    print(f"\nSequence: {header}")
+    if metrics:
+        for key, value in metrics.items():
+            print(f"  {key}: {value}")
 
 
 # Main program
@@ -106,40 +447,145 @@ if __name__ == "__main__":
     print("Protein Sequence Analysis Tool")
     print("=" * 70)
 
-    # Check if a filename was provided
-    if len(sys.argv) < 2:
-        print("\nUsage: python analyze_sequence.py <fasta_file>")
-        print("Example: python analyze_sequence.py sample.fasta")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Analyze protein sequences from a FASTA file.",
+        epilog="Example: python analyze_sequence.py sample.fasta")
+    parser.add_argument("fasta_file", help="FASTA file to analyze")
+    parser.add_argument("--headers", nargs="+", metavar="HEADER",
+                        help="only analyze these records (first word of the header line, as in "
+                             "samtools), fetched through a .fai index")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="number of worker processes (default: 1)")
+    parser.add_argument("--motifs", nargs="+", metavar="MOTIF",
+                        help="report the positions of these motifs in every sequence")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="reuse results for unchanged sequences from this cache file")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES,
+                        help=f"maximum cached results (default: {DEFAULT_MAX_ENTRIES:,})")
+    parser.add_argument("--format", choices=("text",) + FORMATS, default="text",
+                        help="output format (default: text report)")
+    parser.add_argument("-o", "--output",
+                        help="output file (default: analysis_results.txt, or "
+                             "analysis_results.<format> for columnar formats)")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="overlap reading, analysis and writing in separate threads "
+                             "with bounded memory")
+    parser.add_argument("-q", "--quiet", "--summary", action="store_true", dest="quiet",
+                        help="skip per-sequence console output and print only totals")
+    parser.add_argument("--progress", action="store_true",
+                        help="show records/s, residues/s, bytes read and ETA on stderr")
+    parser.add_argument("--profile", metavar="JSON",
+                        help="write per-stage time, call counts and bytes to this JSON file")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="with --profile, also record peak traced memory with tracemalloc "
+                             "(slow; per stage only without --pipeline)")
+    parser.add_argument("--cprofile", metavar="PATH",
+                        help="write cProfile statistics of the main thread to this file")
+    args = parser.parse_args()
+    if args.pipeline and args.headers:
+        parser.error("--pipeline reads the whole file and cannot be combined with --headers")
+    if args.trace_memory and not args.profile:
+        parser.error("--trace-memory needs --profile")
 
-    filename = sys.argv[1]
+    filename = args.fasta_file
     print(f"\nAnalyzing sequences from {filename}...")
     print("-" * 70)
 
-    # Step 1: Read the FASTA file
-    sequences = read_fasta(filename)
+    instrumentation = Instrumentation(enabled=bool(args.profile), track_memory=args.trace_memory)
+    profiler = None
+    if args.cprofile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
 
-    if not sequences:
-        print("Error: No sequences found or could not read file.")
-        sys.exit(1)
+    def finish_profiling(output_file):
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.cprofile)
+            print(f"cProfile statistics written to {args.cprofile}")
+        if args.profile:
+            if output_file and os.path.exists(output_file):
+                instrumentation.add_bytes("write", os.path.getsize(output_file))
+            instrumentation.save(args.profile)
+            print(f"Stage profile written to {args.profile}")
 
-    print(f"Successfully loaded {len(sequences)} sequence(s)\n")
+    output_file = args.output or ("analysis_results.txt" if args.format == "text"
+                                  else "analysis_results" + FILE_EXTENSIONS[args.format])
 
-    # Step 2: Analyze the sequences
-    results = analyze_sequences(sequences)
+    cache = ResultCache(args.cache, max_entries=args.cache_size) if args.cache else None
+    progress = None
+    if args.progress:
+        # Only an uncompressed size is comparable with the bytes parsed
+        total_bytes = (os.path.getsize(filename) if os.path.exists(filename)
+                       and detect_compression(filename) is None else None)
+        progress = ProgressReporter(total_bytes=None if args.headers else total_bytes)
+
+    # Steps 1-4 are streamed: each result is printed and written as it
+    # arrives, so only the running totals are kept in memory. With
+    # --pipeline, reading and analysis also run in background threads.
+    run = {'count': 0, 'residues': 0}
+
+    def report(stream):
+        for header, metrics in stream:
+            run['count'] += 1
+            run['residues'] += metrics['length']
+            if progress is not None:
+                progress.update(metrics['length'])
+            if not args.quiet:
+                # Nested stages pause "write", so console output is not charged to it
+                with instrumentation.stage("print"):
+                    _print_result(header, metrics)
+            yield header, metrics
+        if not run['count']:
+            # Raised through the writer so an existing output file is kept
+            raise ValueError("No sequences found or could not read file.")
 
-    # Step 3: Print summary to console
     print("Analysis Summary:")
     print("-" * 70)
-    for header in results:
-        print(f"\nSequence: {header}")
-        if results[header]:
-            for key, value in results[header].items():
-                print(f"  {key}: {value}")
+    failed = True
+    try:
+        with (FastaIndex(filename) if args.headers else nullcontext()) as index:
+            if args.pipeline:
+                from pipeline import iter_pipelined_fasta
+                analyzed = iter_pipelined_fasta(filename, workers=args.jobs, motifs=args.motifs,
+                                                cache=cache, progress=progress,
+                                                instrumentation=instrumentation)
+            elif args.headers:
+                records = instrumentation.wrap_iter("parse", index.records(args.headers), _record_size)
+                analyzed = instrumentation.wrap_iter("analyze", iter_analyze_sequences(
+                    records, workers=args.jobs, motifs=args.motifs, cache=cache))
+            else:
+                analyzed = iter_analyze_fasta(filename, workers=args.jobs, motifs=args.motifs,
+                                              cache=cache, progress=progress,
+                                              instrumentation=instrumentation)
+            # closing() shuts down workers and threads if writing fails part way
+            with closing(analyzed), instrumentation.stage("write"):
+                written = _write_output(report(analyzed), args.format, output_file)
+        # A write error has already been reported; it still fails the run
+        failed = not written
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found!")
+    except KeyError as e:
+        print(f"Error: {e.args[0]}")
+    except Exception as e:
+        print(f"Error analyzing file: {e}")
+    finally:
+        if cache is not None:
+            cache.close()
+        if progress is not None:
+            progress.finish()
+
+    if failed:
+        sys.exit(1)
 
-    # Step 4: Write results to file
     print("\n" + "-" * 70)
-    write_results(results)
+    print(f"Successfully analyzed {run['count']} sequence(s)")
+    if args.quiet:
+        with instrumentation.stage("print"):
+            _print_totals(run['count'], run['residues'])
+    if cache is not None:
+        print(cache.summary())
+    finish_profiling(output_file)
 
     print("\n" + "=" * 70)
-    print("Analysis complete!")
\ No newline at end of file
+    print("Analysis complete!")
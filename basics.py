@@ -4,6 +4,31 @@ HW3 Part 1: Python Basics Warmup
 Complete the exercises below to refresh your Python fundamentals.
 """
 
+import random
+import time
+from collections import Counter
+
+import numpy as np
+
+from sequence_collection import as_collection
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+# Prefix whose distinct characters give the alphabet size for "auto" and
+# the candidate symbols of the "count" strategy; the counts are checked
+# against the full length
+COUNT_PREFIX = 64
+# (max_symbols, thresholds) tables used by count_characters(strategy="auto"),
+# picked by the distinct characters in the first COUNT_PREFIX characters.
+# Each table holds (max_length, strategy) pairs checked in order; the last
+# entry of each has no limit, as has the last table. Strings no longer than
+# COUNT_PREFIX use the last table without probing, the alphabet making no
+# measurable difference there. Measured with tune_count_characters() on DNA
+# and protein sequences; rerun it for other data.
+COUNT_THRESHOLDS = [
+    (4, [(32, "loop"), (64, "counter"), (1024, "count"), (None, "numpy")]),
+    (None, [(32, "loop"), (128, "counter"), (None, "numpy")]),
+]
+
 # Exercise 1: String Reversal
 # TODO: Write a function that takes a string and returns it reversed
 # Hint: You can use slicing with [::-1] or a loop
@@ -28,12 +53,20 @@ def reverse_string(s):
 # Exercise 2: Character Counter
 # TODO: Write a function that counts how many times each character appears in a string
 # Use a for loop and a dictionary
-def count_characters(s):
+def count_characters(s, strategy="auto"):
     """
     Count occurrences of each character in a string.
 
+    Every strategy returns the same dictionary, with keys in order of first
+    appearance; they differ only in speed. The Python loop wins on short
+    strings, collections.Counter on medium ones and a NumPy bincount on
+    long ones, while str.count per symbol suits medium strings over a small
+    alphabet such as DNA.
+
     Args:
         s (str): Input string
+        strategy (str): "auto" to pick by length and alphabet size from
+            COUNT_THRESHOLDS, or one of "loop", "counter", "count" or "numpy"
 
     Returns:
         dict: Dictionary mapping each character to its count
@@ -42,6 +75,16 @@ def count_characters(s):
         >>> count_characters("AACDE")
         {'A': 2, 'C': 1, 'D': 1, 'E': 1}
     """
+    if strategy == "auto":
+        strategy = _auto_strategy(s)
+    if strategy != "loop":
+        if strategy not in COUNT_STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy!r} "
+                             f"(expected auto or one of {tuple(COUNT_STRATEGIES)})")
+        return COUNT_STRATEGIES[strategy](s)
+
+    # Short strings are counted inline, the call overhead of a strategy
+    # function being a noticeable share of their cost
     # TODO: Implement this function using a for loop
     char_counts = {} 
 
@@ -54,6 +97,108 @@ def count_characters(s):
     return char_counts
 
 
+def _auto_strategy(s):
+    """Pick a count_characters() strategy for s from COUNT_THRESHOLDS."""
+    length = len(s)
+    thresholds = COUNT_THRESHOLDS[-1][1]
+    if length > COUNT_PREFIX:
+        symbols = len(set(s[:COUNT_PREFIX]))
+        for max_symbols, thresholds in COUNT_THRESHOLDS:
+            if max_symbols is None or symbols <= max_symbols:
+                break
+    for max_length, strategy in thresholds:
+        if max_length is None or length <= max_length:
+            return strategy
+
+
+def _count_loop(s):
+    return count_characters(s, "loop")
+
+
+def _count_counter(s):
+    # Counter counts in C and keeps first-appearance order
+    return dict(Counter(s))
+
+
+def _count_str(s):
+    # One C-level str.count per candidate symbol; fall back when the prefix
+    # missed a character that only appears later
+    counts = {char: s.count(char) for char in set(s[:COUNT_PREFIX])}
+    if sum(counts.values()) != len(s):
+        return _count_numpy(s)
+    return {char: counts[char] for char in sorted(counts, key=s.find)}
+
+
+def _count_numpy(s):
+    if not s.isascii():
+        return _count_counter(s)
+    counts = np.bincount(np.frombuffer(s.encode(), dtype=np.uint8), minlength=128).tolist()
+    chars = sorted((chr(code) for code in range(128) if counts[code]), key=s.find)
+    return {char: counts[ord(char)] for char in chars}
+
+
+COUNT_STRATEGIES = {
+    "loop": _count_loop,
+    "counter": _count_counter,
+    "count": _count_str,
+    "numpy": _count_numpy,
+}
+
+
+def tune_count_characters(alphabet=AMINO_ACIDS, lengths=(8, 16, 32, 64, 128, 256, 512,
+                                                        1024, 4096, 16384, 65536),
+                          min_time=0.05):
+    """
+    Time every count_characters() strategy and update COUNT_THRESHOLDS.
+
+    Random strings over `alphabet` are counted at each length, and the
+    fastest strategy per length becomes the "auto" choice up to that
+    length; the strategy winning at the longest length covers the rest.
+    The result replaces (or is added as) the table for alphabets of
+    len(set(alphabet)) symbols.
+
+    Args:
+        alphabet (str): Symbols of the data the thresholds are tuned for
+        lengths (iterable): String lengths to measure, in increasing order
+        min_time (float): Seconds to spend timing each strategy per length
+
+    Returns:
+        dict: length -> {strategy: seconds per call}
+    """
+    rng = random.Random(0)
+    timings = {}
+    thresholds = []
+    for length in lengths:
+        s = ''.join(rng.choices(alphabet, k=length))
+        timings[length] = {}
+        for name, func in COUNT_STRATEGIES.items():
+            calls = 0
+            start = time.perf_counter()
+            while True:
+                func(s)
+                calls += 1
+                elapsed = time.perf_counter() - start
+                if elapsed >= min_time:
+                    break
+            timings[length][name] = elapsed / calls
+        best = min(timings[length], key=timings[length].get)
+        if thresholds and thresholds[-1][1] == best:
+            thresholds[-1] = (length, best)
+        else:
+            thresholds.append((length, best))
+
+    thresholds[-1] = (None, thresholds[-1][1])
+    symbols = len(set(alphabet))
+    tables = dict(COUNT_THRESHOLDS)
+    tables[symbols] = thresholds
+    # Keep the tables ordered by alphabet size, the unlimited one last
+    sizes = sorted(size for size in tables if size is not None)
+    COUNT_THRESHOLDS[:] = [(size, tables[size]) for size in sizes]
+    if None in tables:
+        COUNT_THRESHOLDS.append((None, tables[None]))
+    return timings
+
+
 # Exercise 3: Amino Acid Composition
 # TODO: Write a function that calculates the percentage composition of each amino acid in a protein sequence
 # Return frequencies as percentages
@@ -83,6 +228,41 @@ def amino_acid_composition(protein_seq):
     return composition
 
 
+def composition_matrix(sequences):
+    """
+    Calculate the amino acid composition of many sequences at once.
+
+    Equivalent to calling amino_acid_composition() on every sequence, but
+    the sequences are counted together in one concatenated buffer with
+    NumPy, so no per-record dictionaries are built. Rows can be fed
+    directly to scikit-learn and similar libraries.
+
+    Args:
+        sequences: A FASTA path, a SequenceCollection, a dict of
+            header -> sequence or an iterable of (header, sequence) pairs
+
+    Returns:
+        tuple: (matrix, headers) where matrix is an N x 20 float array of
+            percentages with columns in AMINO_ACIDS order, and headers[i]
+            names row i. Percentages are of the full sequence length, so a
+            row sums to less than 100 when non-standard residues occur.
+
+    Example:
+        >>> matrix, headers = composition_matrix({"p1": "AACCDDEE"})
+        >>> matrix[0, :4]
+        array([25., 25., 25., 25.])
+    """
+    collection = as_collection(sequences)
+    counts = collection.residue_counts(AMINO_ACIDS)
+    lengths = collection.lengths()
+    matrix = np.zeros(counts.shape, dtype=np.float64)
+    # Divide before scaling, in the same order as amino_acid_composition(),
+    # so every entry matches it to the last bit
+    np.divide(counts, lengths[:, None], out=matrix, where=lengths[:, None] > 0)
+    matrix *= 100
+    return matrix, list(collection.keys())
+
+
 # Exercise 4: List Comprehension
 # TODO: Write a function that filters sequences by minimum length using a list comprehension
 def filter_sequences_by_length(sequences, min_length):
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the sequence analysis scripts.
+Run with: python benchmark.py [benchmark ...]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+import basics
+from kmer_counter import count_kmers
+from read_fasta import read_fasta
+from sequence_index import SequenceIndex
+import sequence_utils
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def random_protein(length, seed=0):
+    """
+    Generate a random protein sequence.
+
+    Args:
+        length (int): Number of residues
+        seed (int): Random seed so runs are reproducible
+
+    Returns:
+        str: Random sequence over the 20 standard amino acids
+    """
+    rng = random.Random(seed)
+    return ''.join(rng.choices(AMINO_ACIDS, k=length))
+
+
+def random_database(total_residues, length=400, seed=0):
+    """
+    Generate a dictionary of random proteins totalling about total_residues.
+
+    Uses numpy so that databases of hundreds of millions of residues can be
+    generated in seconds.
+    """
+    rng = np.random.default_rng(seed)
+    alphabet = np.frombuffer(AMINO_ACIDS.encode(), dtype=np.uint8)
+    residues = alphabet[rng.integers(0, len(alphabet), size=total_residues)].tobytes().decode()
+    return {f"seq{i}": residues[start:start + length]
+            for i, start in enumerate(range(0, total_residues, length))}
+
+
+def write_fasta(filename, records, line_width=60):
+    """
+    Write (header, sequence) records to a FASTA file with wrapped lines.
+
+    Args:
+        filename (str): Output path
+        records (iterable): (header, sequence) pairs
+        line_width (int): Residues per sequence line
+    """
+    with open(filename, 'w') as f:
+        for header, seq in records:
+            f.write(f">{header}\n")
+            for i in range(0, len(seq), line_width):
+                f.write(seq[i:i + line_width] + "\n")
+
+
+def time_call(func, *args, repeat=3):
+    """Return the best wall-clock time in seconds over `repeat` calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_read_fasta_scaling(lengths=(1_000_000, 4_000_000, 16_000_000)):
+    """
+    Time read_fasta on single-record files of increasing length.
+
+    Parsing should scale linearly, so the time per residue stays flat
+    as the record grows.
+    """
+    print("\nread_fasta: single wrapped record")
+    print(f"  {'residues':>12}  {'seconds':>8}  {'ns/residue':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for length in lengths:
+            path = os.path.join(tmp, f"single_{length}.fasta")
+            write_fasta(path, [("record", random_protein(length))])
+            seconds = time_call(read_fasta, path)
+            print(f"  {length:>12,}  {seconds:>8.3f}  {seconds / length * 1e9:>10.1f}")
+
+
+def bench_metric_backends(length=1_000_000):
+    """Compare the python and numpy backends of the sequence_utils metrics."""
+    seq = random_protein(length)
+    print(f"\nsequence_utils metrics on {length:,} residues")
+    print(f"  {'function':<24}  {'python s':>8}  {'numpy s':>8}  {'speedup':>7}")
+    for func in (sequence_utils.molecular_weight,
+                 sequence_utils.count_hydrophobic,
+                 sequence_utils.count_charged_residues):
+        assert func(seq, backend="python") == func(seq, backend="numpy")
+        python_s = time_call(func, seq, "python")
+        numpy_s = time_call(func, seq, "numpy")
+        print(f"  {func.__name__:<24}  {python_s:>8.3f}  {numpy_s:>8.3f}  {python_s / numpy_s:>6.1f}x")
+
+
+def separate_metrics(sequences):
+    """Per-sequence metrics computed with one python-backend call per metric."""
+    for seq in sequences:
+        sequence_utils.molecular_weight(seq)
+        sequence_utils.count_hydrophobic(seq)
+        sequence_utils.count_charged_residues(seq)
+
+
+def fused_metrics(sequences):
+    """Per-sequence metrics computed from one shared residue histogram."""
+    for seq in sequences:
+        sequence_utils.sequence_metrics(seq)
+
+
+def bench_fused_metrics(count=20_000, lengths=(8, 15, 30, 60, 120, 350)):
+    """
+    Compare separate metric scans with the fused and batched kernels.
+
+    Short peptides are included because per-call NumPy overhead, not the
+    scan itself, dominates their cost.
+    """
+    print(f"\nPer-sequence metrics on {count:,} sequences (speedup over separate scans)")
+    print(f"  {'aa':>5}  {'separate s':>10}  {'fused s':>8}  {'batched s':>9}")
+    for length in lengths:
+        sequences = [random_protein(length, seed=i) for i in range(count)]
+        separate_s = time_call(separate_metrics, sequences)
+        fused_s = time_call(fused_metrics, sequences)
+        batched_s = time_call(sequence_utils.sequence_metrics_many, sequences)
+        print(f"  {length:>5}  {separate_s:>10.3f}  {fused_s:>8.3f} ({separate_s / fused_s:4.1f}x)"
+              f"  {batched_s:>9.3f} ({separate_s / batched_s:4.1f}x)")
+
+
+def bench_sequence_index(total_residues=100_000_000, motifs=("LVKA", "NGST", "WW", "C")):
+    """Time suffix-array construction and motif queries on a random database."""
+    sequences = random_database(total_residues)
+    print(f"\nSequenceIndex over {total_residues:,} residues in {len(sequences):,} sequences")
+    start = time.perf_counter()
+    index = SequenceIndex(sequences)
+    print(f"  build: {time.perf_counter() - start:.1f} s")
+    for motif in motifs:
+        seconds = time_call(index.find, motif)
+        print(f"  find({motif!r}): {index.count(motif):>10,} hits in {seconds * 1000:8.2f} ms")
+
+
+def bench_composition_matrix(count=100_000, length=350):
+    """Compare per-sequence composition dicts with the batched composition matrix."""
+    sequences = random_database(count * length, length)
+    per_record_s = time_call(lambda: [basics.amino_acid_composition(seq)
+                                      for seq in sequences.values()], repeat=1)
+    batched_s = time_call(basics.composition_matrix, sequences, repeat=1)
+    print(f"\nAmino acid composition of {count:,} sequences of {length} aa")
+    print(f"  per-record dicts: {per_record_s:.3f} s")
+    print(f"  batched matrix:   {batched_s:.3f} s  ({per_record_s / batched_s:.1f}x faster)")
+
+
+def bench_count_characters(alphabets=(("protein", AMINO_ACIDS), ("DNA", "ACGT"))):
+    """
+    Show where each count_characters() strategy starts to win.
+
+    Runs the auto-tuner per alphabet and prints microseconds per call; the
+    thresholds it selects for each alphabet size are printed and then the
+    defaults are restored.
+    """
+    defaults = list(basics.COUNT_THRESHOLDS)
+    for name, alphabet in alphabets:
+        timings = basics.tune_count_characters(alphabet)
+        strategies = list(basics.COUNT_STRATEGIES)
+        print(f"\ncount_characters on {name} strings (us per call)")
+        print(f"  {'length':>7}" + "".join(f"  {strategy:>8}" for strategy in strategies) + "  fastest")
+        for length, seconds in timings.items():
+            print(f"  {length:>7}" + "".join(f"  {seconds[s] * 1e6:>8.1f}" for s in strategies)
+                  + f"  {min(seconds, key=seconds.get)}")
+        print(f"  thresholds for {len(set(alphabet))} symbols: "
+              f"{dict(basics.COUNT_THRESHOLDS)[len(set(alphabet))]}")
+    basics.COUNT_THRESHOLDS[:] = defaults
+
+
+def bench_hydropathy(count=2_000, length=400, window=19):
+    """Compare count_hydrophobic() on every window slice with the prefix-sum profiles."""
+    sequences = random_database(count * length, length)
+
+    def sliced():
+        for seq in sequences.values():
+            [sequence_utils.count_hydrophobic(seq[i:i + window]) for i in range(len(seq) - window + 1)]
+
+    sliced_s = time_call(sliced, repeat=1)
+    profile_s = time_call(sequence_utils.hydropathy_profiles, sequences, window, "hydrophobic")
+    print(f"\nHydrophobic window counts (window {window}) on {count:,} sequences of {length} aa")
+    print(f"  slice per window: {sliced_s:.3f} s")
+    print(f"  prefix sums:      {profile_s:.3f} s  ({sliced_s / profile_s:.0f}x faster)")
+
+
+def bench_isoelectric(count=200_000, length=300):
+    """Time pI and pH 0-14 charge curves for many sequences at once."""
+    sequences = random_database(count * length, length)
+    points_s = time_call(sequence_utils.isoelectric_points, sequences, repeat=1)
+    curves_s = time_call(sequence_utils.charge_curves, sequences, repeat=1)
+    sample = dict(list(sequences.items())[:1_000])
+    single_s = time_call(lambda: [sequence_utils.isoelectric_point(seq) for seq in sample.values()],
+                         repeat=1)
+    print(f"\nIsoelectric points of {count:,} sequences of {length} aa")
+    print(f"  one call per sequence: {single_s / len(sample) * count:.3f} s (extrapolated)")
+    print(f"  batched bisection:     {points_s:.3f} s")
+    print(f"  charge curves (29 pH): {curves_s:.3f} s")
+
+
+def bench_kmers(total_residues=20_000_000, ks=(2, 3, 5, 7)):
+    """Time k-mer spectra over a random database, with the dict-based count for reference."""
+    sequences = random_database(total_residues)
+    sample = dict(list(sequences.items())[:1_000])
+    sample_residues = sum(len(seq) for seq in sample.values())
+
+    def dict_count(k):
+        counts = {}
+        for seq in sample.values():
+            for i in range(len(seq) - k + 1):
+                kmer = seq[i:i + k]
+                counts[kmer] = counts.get(kmer, 0) + 1
+        return counts
+
+    print(f"\nk-mer spectra over {total_residues:,} residues")
+    print(f"  {'k':>2}  {'distinct':>10}  {'numpy s':>8}  {'dict s':>8}")
+    for k in ks:
+        start = time.perf_counter()
+        counts = count_kmers(sequences, k)
+        seconds = time.perf_counter() - start
+        dict_s = time_call(dict_count, k, repeat=1) * total_residues / sample_residues
+        print(f"  {k:>2}  {len(counts):>10,}  {seconds:>8.2f}  {dict_s:>8.2f}")
+    print("  (dict times extrapolated from the first 1,000 sequences)")
+
+
+BENCHMARKS = {
+    'read_fasta': bench_read_fasta_scaling,
+    'backends': bench_metric_backends,
+    'fused': bench_fused_metrics,
+    'index': bench_sequence_index,
+    'composition': bench_composition_matrix,
+    'count_characters': bench_count_characters,
+    'hydropathy': bench_hydropathy,
+    'isoelectric': bench_isoelectric,
+    'kmers': bench_kmers,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run sequence analysis benchmarks.")
+    parser.add_argument("benchmarks", nargs="*", metavar="BENCHMARK",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    print("Sequence Analysis Benchmarks")
+    print("=" * 50)
+
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name]()
+
+    print("\n" + "=" * 50)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+Reproducible throughput and memory benchmarks for the hot functions in
+sequence_utils, basics and read_fasta, with saved baselines and a
+regression check.
+
+Run with:
+    python benchmark_suite.py run --save benchmark_baseline.json
+    python benchmark_suite.py compare benchmark_baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+import basics
+import sequence_utils
+from benchmark import random_database, write_fasta, time_call
+from read_fasta import read_fasta, iter_fasta, iter_fasta_bytes
+
+# Synthetic datasets: total residues and residues per record. All use a
+# fixed seed, so every run benchmarks exactly the same input.
+SCALES = {
+    '1kb': {'residues': 800, 'length': 200},
+    'tiny_records': {'residues': 2_000_000, 'length': 10},
+    'huge_record': {'residues': 20_000_000, 'length': 20_000_000},
+    '100mb': {'residues': 100_000_000, 'length': 400},
+}
+DEFAULT_SCALES = ('1kb', 'tiny_records')
+# Relative throughput drop reported as a regression by compare
+DEFAULT_THRESHOLD = 0.10
+# Inputs larger than this are timed once instead of best-of-three
+SINGLE_RUN_RESIDUES = 10_000_000
+# Small inputs are looped until one timing takes at least this long
+MIN_TIMING_SECONDS = 0.2
+
+
+def _each(func, *args):
+    """Benchmark body that applies func to every sequence."""
+    def run(sequences, path):
+        for seq in sequences.values():
+            func(seq, *args)
+    return run
+
+
+# Benchmark name -> body taking (sequences, fasta_path); sequences is
+# None for FILE_CASES
+CASES = {
+    'read_fasta': lambda sequences, path: read_fasta(path),
+    'iter_fasta': lambda sequences, path: sum(1 for _ in iter_fasta(path)),
+    'iter_fasta_bytes': lambda sequences, path: sum(1 for _ in iter_fasta_bytes(path)),
+    'molecular_weight': _each(sequence_utils.molecular_weight),
+    'molecular_weight[numpy]': _each(sequence_utils.molecular_weight, "numpy"),
+    'count_hydrophobic': _each(sequence_utils.count_hydrophobic),
+    'count_hydrophobic[numpy]': _each(sequence_utils.count_hydrophobic, "numpy"),
+    'count_charged_residues': _each(sequence_utils.count_charged_residues),
+    'count_charged_residues[numpy]': _each(sequence_utils.count_charged_residues, "numpy"),
+    'sequence_metrics': _each(sequence_utils.sequence_metrics),
+    'sequence_metrics_many': lambda sequences, path: sequence_utils.sequence_metrics_many(
+        list(sequences.values())),
+    'find_motif': _each(sequence_utils.find_motif, "GK"),
+    'count_characters': _each(basics.count_characters),
+    'amino_acid_composition': _each(basics.amino_acid_composition),
+}
+# Cases that read the FASTA file themselves, so the records are not
+# preloaded and peak RSS reflects only the reader
+FILE_CASES = {'read_fasta', 'iter_fasta', 'iter_fasta_bytes'}
+
+
+def dataset_path(scale, data_dir):
+    """Write the FASTA file for a scale into data_dir (once) and return its path."""
+    path = os.path.join(data_dir, f"{scale}.fasta")
+    if not os.path.exists(path):
+        spec = SCALES[scale]
+        write_fasta(path, random_database(spec['residues'], spec['length']).items())
+    return path
+
+
+def _peak_rss_mb():
+    # On Linux ru_maxrss survives fork and exec, so a spawned worker would
+    # start at the parent's RSS; VmHWM belongs to this process image only.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_case(case, scale, data_dir):
+    """Run one benchmark in a fresh process so peak RSS is not shared."""
+    path = dataset_path(scale, data_dir)
+    if case in FILE_CASES:
+        sequences = None
+        residues = SCALES[scale]['residues']
+    else:
+        sequences = read_fasta(path)
+        residues = sum(len(seq) for seq in sequences.values())
+    body = CASES[case]
+    if residues > SINGLE_RUN_RESIDUES:
+        seconds = time_call(body, sequences, path, repeat=1)
+    else:
+        # Loop tiny inputs enough times that timer resolution does not matter
+        loops = 1
+        while time_call(body, sequences, path, repeat=1) * loops < MIN_TIMING_SECONDS:
+            loops *= 10
+
+        def looped(sequences, path):
+            for _ in range(loops):
+                body(sequences, path)
+
+        seconds = time_call(looped, sequences, path, repeat=3) / loops
+    return {
+        'seconds': seconds,
+        'residues': residues,
+        'residues_per_s': residues / seconds if seconds else float('inf'),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_suite(cases=None, scales=DEFAULT_SCALES, data_dir=None, verbose=True):
+    """
+    Run benchmarks and return the results as a JSON-serializable dict.
+
+    Args:
+        cases (iterable): Benchmark names from CASES (default: all)
+        scales (iterable): Dataset names from SCALES
+        data_dir (str): Where to keep generated FASTA files (default: a
+            temporary directory removed afterwards)
+        verbose (bool): Print each result as it completes
+
+    Returns:
+        dict: {'meta': {...}, 'results': {"case@scale": {...}}}
+    """
+    cases = list(cases or CASES)
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'scales': list(scales),
+        },
+        'results': {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = data_dir or tmp
+        context = multiprocessing.get_context('spawn')
+        for scale in scales:
+            dataset_path(scale, data_dir)
+            for case in cases:
+                with context.Pool(1) as pool:
+                    result = pool.apply(_run_case, (case, scale, data_dir))
+                key = f"{case}@{scale}"
+                report['results'][key] = result
+                if verbose:
+                    print(f"  {key:<42} {result['residues_per_s']:>14,.0f} residues/s"
+                          f"  {result['peak_rss_mb']:>8.1f} MB peak")
+    return report
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two suite reports and list throughput regressions.
+
+    Args:
+        baseline (dict): Report from run_suite() used as reference
+        current (dict): Newer report
+        threshold (float): Relative slowdown that counts as a regression
+
+    Returns:
+        list: (key, baseline residues/s, current residues/s, change) tuples
+            for every benchmark that slowed down by more than threshold
+    """
+    regressions = []
+    print(f"  {'benchmark':<42} {'baseline':>14} {'current':>14} {'change':>8}")
+    for key, before in baseline['results'].items():
+        after = current['results'].get(key)
+        if after is None:
+            continue
+        change = after['residues_per_s'] / before['residues_per_s'] - 1
+        flag = "  REGRESSION" if change < -threshold else ""
+        print(f"  {key:<42} {before['residues_per_s']:>14,.0f} "
+              f"{after['residues_per_s']:>14,.0f} {change:>+8.1%}{flag}")
+        if flag:
+            regressions.append((key, before['residues_per_s'], after['residues_per_s'], change))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run or compare the benchmark suite.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--cases", nargs="+", choices=list(CASES), metavar="CASE",
+                            help=f"benchmarks to run (default: all): {', '.join(CASES)}")
+    run_parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=list(DEFAULT_SCALES),
+                            help=f"datasets to use (default: {' '.join(DEFAULT_SCALES)})")
+    run_parser.add_argument("--save", metavar="JSON", help="write the results to this file")
+    run_parser.add_argument("--data-dir", help="keep generated FASTA files here between runs")
+
+    compare_parser = commands.add_parser("compare", help="compare against a saved baseline")
+    compare_parser.add_argument("baseline", help="baseline JSON from 'run --save'")
+    compare_parser.add_argument("current", nargs="?",
+                                help="results JSON to compare (default: run the suite now)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"relative slowdown flagged as a regression "
+                                     f"(default: {DEFAULT_THRESHOLD})")
+    compare_parser.add_argument("--data-dir", help="keep generated FASTA files here between runs")
+    args = parser.parse_args()
+
+    print("Benchmark Suite")
+    print("=" * 50)
+
+    if args.command == "run":
+        report = run_suite(args.cases, args.scales, args.data_dir)
+        if args.save:
+            with open(args.save, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"\nResults saved to {args.save}")
+        sys.exit(0)
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        cases = sorted({key.split('@')[0] for key in baseline['results']} & set(CASES))
+        current = run_suite(cases, baseline['meta']['scales'], args.data_dir)
+
+    print()
+    regressions = compare(baseline, current, args.threshold)
+    print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Columnar Result Output
+Write analysis results as typed columns (TSV, NumPy .npz, Arrow or Parquet)
+so downstream jobs can load them without parsing the text report.
+"""
+
+import numpy as np
+
+FORMATS = ('tsv', 'npz', 'arrow', 'parquet')
+FILE_EXTENSIONS = {'tsv': '.tsv', 'npz': '.npz', 'arrow': '.arrow', 'parquet': '.parquet'}
+# Rows buffered before a batch is written out
+BATCH_SIZE = 100_000
+
+# Output columns and their dtypes; net_charge is derived when buffering
+COLUMNS = {
+    'header': object,
+    'length': np.int64,
+    'molecular_weight': np.float64,
+    'hydrophobic_count': np.int64,
+    'positive_charge': np.int64,
+    'negative_charge': np.int64,
+    'net_charge': np.int64,
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Arrow and Parquet output require pyarrow "
+                          "(conda install pyarrow)") from None
+    return pyarrow
+
+
+def _iter_batches(results, batch_size):
+    """Group (header, metrics) pairs into dicts of typed column arrays."""
+    items = results.items() if hasattr(results, 'items') else results
+    rows = []
+    for item in items:
+        rows.append(item)
+        if len(rows) >= batch_size:
+            yield _to_columns(rows)
+            rows = []
+    if rows:
+        yield _to_columns(rows)
+
+
+def _to_columns(rows):
+    """Convert a list of (header, metrics) pairs into typed column arrays."""
+    columns = {'header': np.array([header for header, _ in rows], dtype=object)}
+    for name in ('length', 'molecular_weight', 'hydrophobic_count',
+                 'positive_charge', 'negative_charge'):
+        columns[name] = np.array([metrics[name] for _, metrics in rows], dtype=COLUMNS[name])
+    columns['net_charge'] = columns['positive_charge'] - columns['negative_charge']
+
+    # Motif reports become one hit-count column per motif
+    motif_names = rows[0][1].get('motifs', {})
+    for motif in motif_names:
+        columns[f'motif_{motif}'] = np.array(
+            [len(metrics['motifs'][motif]) for _, metrics in rows], dtype=np.int64)
+    return columns
+
+
+def _write_tsv(batches, output_file):
+    with open(output_file, 'w') as f:
+        wrote_header = False
+        for columns in batches:
+            if not wrote_header:
+                f.write("\t".join(columns) + "\n")
+                wrote_header = True
+            formatted = [column.astype(str) if name != 'molecular_weight'
+                         else np.char.mod('%.2f', column)
+                         for name, column in columns.items()]
+            f.write("".join("\t".join(row) + "\n" for row in zip(*formatted)))
+        if not wrote_header:
+            f.write("\t".join(COLUMNS) + "\n")
+
+
+def _write_npz(batches, output_file):
+    # .npz archives cannot be appended to, so batches are concatenated first
+    parts = list(batches)
+    if not parts:
+        np.savez(output_file, **{name: np.array([], dtype=dtype) for name, dtype in COLUMNS.items()})
+        return
+    merged = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    merged['header'] = merged['header'].astype(str)
+    np.savez(output_file, **merged)
+
+
+def _arrow_batches(batches):
+    pa = _require_pyarrow()
+    for columns in batches:
+        yield pa.record_batch({name: pa.array(column) for name, column in columns.items()})
+
+
+def _write_arrow(batches, output_file):
+    pa = _require_pyarrow()
+    writer = None
+    try:
+        for batch in _arrow_batches(batches):
+            if writer is None:
+                writer = pa.ipc.new_file(output_file, batch.schema)
+            writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_parquet(batches, output_file):
+    _require_pyarrow()
+    import pyarrow.parquet as pq
+    writer = None
+    try:
+        for batch in _arrow_batches(batches):
+            if writer is None:
+                writer = pq.ParquetWriter(output_file, batch.schema)
+            writer.write_batch(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+_WRITERS = {'tsv': _write_tsv, 'npz': _write_npz, 'arrow': _write_arrow, 'parquet': _write_parquet}
+
+
+def write_columnar_results(results, output_file, fmt, batch_size=BATCH_SIZE):
+    """
+    Write analysis results in a columnar format.
+
+    Rows are buffered into typed column arrays and written batch_size rows
+    at a time. Arrow (IPC file) output can be memory-mapped with
+    pyarrow.memory_map, and both Arrow and Parquet load directly with
+    pandas.read_feather / pandas.read_parquet.
+
+    Args:
+        results (dict or iterable): Results from analyze_sequences(), or
+            (header, metrics) pairs
+        output_file (str): Output filename
+        fmt (str): One of FORMATS
+        batch_size (int): Rows per written batch
+
+    Raises:
+        ValueError: If fmt is not a supported format
+        ImportError: If Arrow or Parquet output is requested without pyarrow
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown output format: {fmt!r} (expected one of {FORMATS})")
+    _WRITERS[fmt](_iter_batches(results, batch_size), output_file)
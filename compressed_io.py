@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Compressed Input
+Open plain, gzip, bgzip (BGZF) and zstd files transparently, detected by
+magic bytes, with threaded BGZF decompression and .gzi random access.
+"""
+
+import bisect
+import io
+import os
+import struct
+import sys
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# Uncompressed bytes per BGZF block written by bgzip_file(); the format caps
+# each block at 64 KiB of compressed data, so leave room for incompressible input.
+BGZF_BLOCK_SIZE = 0xff00
+# Empty block that marks the end of a BGZF file
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+# Blocks decompressed ahead of the reader per thread
+BLOCKS_PER_THREAD = 4
+
+
+def detect_compression(filename):
+    """
+    Identify the compression of a file from its first bytes.
+
+    Args:
+        filename (str): Path to the file
+
+    Returns:
+        str: "bgzf", "gzip" or "zstd", or None for an uncompressed file
+    """
+    with open(filename, 'rb') as f:
+        head = f.read(18)
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    if not head.startswith(GZIP_MAGIC):
+        return None
+    # BGZF is gzip with a 'BC' extra subfield holding the block size
+    if len(head) >= 18 and head[3] & 4 and head[12:14] == b'BC':
+        return "bgzf"
+    return "gzip"
+
+
+def _read_bgzf_block(f):
+    """
+    Read the next raw BGZF block.
+
+    Returns:
+        tuple: (payload, crc, size) for zlib.decompress(), or None at end of file
+    """
+    header = f.read(12)
+    if not header:
+        return None
+    if len(header) < 12 or not header.startswith(GZIP_MAGIC) or not header[3] & 4:
+        raise ValueError("Corrupt BGZF block header")
+    extra = f.read(struct.unpack('<H', header[10:12])[0])
+    block_size = None
+    position = 0
+    while position + 4 <= len(extra):
+        subfield_length = struct.unpack('<H', extra[position + 2:position + 4])[0]
+        if extra[position:position + 2] == b'BC':
+            block_size = struct.unpack('<H', extra[position + 4:position + 6])[0] + 1
+        position += 4 + subfield_length
+    if block_size is None:
+        raise ValueError("Corrupt BGZF block: missing BC block size field")
+
+    rest = f.read(block_size - 12 - len(extra))
+    if len(rest) < 8:
+        raise ValueError("Truncated BGZF block")
+    crc, size = struct.unpack('<II', rest[-8:])
+    return rest[:-8], crc, size
+
+
+def _inflate_bgzf_block(payload, crc, size):
+    """Decompress one block and check its CRC; zlib releases the GIL for both."""
+    data = zlib.decompress(payload, -15)
+    if len(data) != size or zlib.crc32(data) != crc:
+        raise ValueError("BGZF block failed its CRC check")
+    return data
+
+
+def iter_bgzf_blocks(f, threads=None):
+    """
+    Decompress the blocks of a BGZF stream in order, several at a time.
+
+    Blocks are independent deflate streams, so they are inflated on a
+    thread pool while the file is read sequentially; at most
+    BLOCKS_PER_THREAD blocks per thread are held in memory.
+
+    Args:
+        f (file): Binary file object positioned at a block boundary
+        threads (int): Decompression threads (default: CPU count)
+
+    Yields:
+        tuple: (compressed_offset, data) for each block
+    """
+    threads = threads or os.cpu_count() or 1
+    offset = f.tell()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        pending = deque()
+        while True:
+            block = _read_bgzf_block(f)
+            if block is not None:
+                pending.append((offset, pool.submit(_inflate_bgzf_block, *block)))
+                offset = f.tell()
+            if pending and (block is None or len(pending) >= threads * BLOCKS_PER_THREAD):
+                block_offset, future = pending.popleft()
+                yield block_offset, future.result()
+            elif block is None:
+                return
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only raw stream over an iterator of bytes chunks."""
+
+    def __init__(self, chunks, close=None):
+        self._chunks = chunks
+        self._buffer = b''
+        self._close = close
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._buffer = memoryview(chunk)
+        count = min(len(b), len(self._buffer))
+        b[:count] = self._buffer[:count]
+        self._buffer = self._buffer[count:]
+        return count
+
+    def close(self):
+        if not self.closed:
+            self._chunks.close()
+            if self._close is not None:
+                self._close()
+        super().close()
+
+
+def open_input(filename, mode='rb', threads=None):
+    """
+    Open a possibly compressed file for streaming reads.
+
+    The compression is detected from the magic bytes, not the extension.
+    BGZF files are inflated on a thread pool, other gzip files with the
+    gzip module and zstd files with the optional zstandard package.
+
+    Args:
+        filename (str): Path to the file
+        mode (str): "rb" for bytes or "r" for text
+        threads (int): BGZF decompression threads (default: CPU count)
+
+    Returns:
+        file: Readable file object
+
+    Raises:
+        ImportError: For zstd input without the zstandard package
+    """
+    if mode not in ('r', 'rb'):
+        raise ValueError(f"Unsupported mode: {mode!r} (expected 'r' or 'rb')")
+    compression = detect_compression(filename)
+    if compression is None:
+        return open(filename, mode)
+
+    raw = open(filename, 'rb')
+    if compression == "bgzf":
+        chunks = (data for _, data in iter_bgzf_blocks(raw, threads))
+        stream = io.BufferedReader(_ChunkStream(chunks, raw.close), BGZF_BLOCK_SIZE)
+    elif compression == "gzip":
+        import gzip
+        stream = gzip.GzipFile(fileobj=raw)
+        stream.myfileobj = raw  # close the underlying file with the stream
+    else:
+        try:
+            import zstandard
+        except ImportError:
+            raw.close()
+            raise ImportError("zstd input requires the zstandard package") from None
+        stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True))
+    return stream if mode == 'rb' else io.TextIOWrapper(stream)
+
+
+def bgzip_file(filename, output_file=None, index=True):
+    """
+    Compress a file with BGZF, the blocked gzip format read by samtools.
+
+    Args:
+        filename (str): Path to the uncompressed file
+        output_file (str): Output path (defaults to filename + '.gz')
+        index (bool): Also write a .gzi index next to the output
+
+    Returns:
+        str: Path of the compressed file
+    """
+    if output_file is None:
+        output_file = filename + '.gz'
+    offsets = []
+    uncompressed = 0
+
+    with open(filename, 'rb') as source, open(output_file, 'wb') as out:
+        for data in iter(lambda: source.read(BGZF_BLOCK_SIZE), b''):
+            offsets.append((out.tell(), uncompressed))
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            payload = compressor.compress(data) + compressor.flush()
+            out.write(struct.pack('<4BI2BH2BHH', 0x1f, 0x8b, 8, 4, 0, 0, 0xff, 6,
+                                  ord('B'), ord('C'), 2, len(payload) + 25))
+            out.write(payload)
+            out.write(struct.pack('<II', zlib.crc32(data), len(data)))
+            uncompressed += len(data)
+        out.write(BGZF_EOF)
+
+    if index:
+        _write_gzi(output_file + '.gzi', offsets)
+    return output_file
+
+
+def _write_gzi(index_filename, offsets):
+    """Write a bgzip-compatible .gzi index; the implicit (0, 0) block is omitted."""
+    entries = offsets[1:]
+    with open(index_filename, 'wb') as f:
+        f.write(struct.pack('<Q', len(entries)))
+        for compressed, uncompressed in entries:
+            f.write(struct.pack('<QQ', compressed, uncompressed))
+
+
+def build_gzi_index(filename, index_filename=None):
+    """
+    Scan a BGZF file once and write its .gzi block index.
+
+    Each entry maps the compressed offset of a block to the uncompressed
+    offset of its first byte, in the layout written by `bgzip -i`.
+
+    Args:
+        filename (str): Path to a BGZF file
+        index_filename (str): Output path (defaults to filename + '.gzi')
+
+    Returns:
+        str: Path of the written index
+    """
+    if index_filename is None:
+        index_filename = filename + '.gzi'
+    offsets = []
+    uncompressed = 0
+    with open(filename, 'rb') as f:
+        while True:
+            offset = f.tell()
+            block = _read_bgzf_block(f)
+            if block is None:
+                break
+            if block[2]:  # skip empty blocks such as the EOF marker
+                offsets.append((offset, uncompressed))
+                uncompressed += block[2]
+    _write_gzi(index_filename, offsets)
+    return index_filename
+
+
+class BgzfFile:
+    """
+    Random access to the uncompressed bytes of a BGZF file.
+
+    A .gzi index maps uncompressed offsets to blocks, so a read only
+    inflates the blocks that overlap the requested range. Slicing returns
+    bytes like a memory map, which lets FastaIndex fetch records from
+    bgzipped FASTA files.
+
+    Example:
+        >>> with BgzfFile("sample.fasta.gz") as data:
+        ...     data[0:6]
+        b'>hemog'
+    """
+
+    def __init__(self, filename, index_filename=None):
+        """
+        Open a BGZF file and its index, building the index if missing.
+
+        Args:
+            filename (str): Path to a BGZF file
+            index_filename (str): Path to .gzi (defaults to filename + '.gzi')
+
+        Raises:
+            ValueError: If the file is not BGZF compressed
+        """
+        if detect_compression(filename) != "bgzf":
+            raise ValueError(f"Not a BGZF file: {filename} (recompress with bgzip)")
+        if index_filename is None:
+            index_filename = filename + '.gzi'
+        if not os.path.exists(index_filename):
+            build_gzi_index(filename, index_filename)
+
+        with open(index_filename, 'rb') as f:
+            count = struct.unpack('<Q', f.read(8))[0]
+            entries = struct.unpack(f'<{2 * count}Q', f.read(16 * count))
+        self._compressed = [0] + list(entries[0::2])
+        self._uncompressed = [0] + list(entries[1::2])
+        self._file = open(filename, 'rb')
+        self._cached = (None, b'')  # most recently inflated block
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the file handle."""
+        self._file.close()
+
+    def _block(self, i):
+        if self._cached[0] != i:
+            self._file.seek(self._compressed[i])
+            block = _read_bgzf_block(self._file)
+            self._cached = (i, _inflate_bgzf_block(*block) if block else b'')
+        return self._cached[1]
+
+    def read_at(self, offset, size):
+        """
+        Read up to `size` uncompressed bytes starting at `offset`.
+
+        Args:
+            offset (int): Uncompressed byte offset
+            size (int): Number of bytes to read
+
+        Returns:
+            bytes: The requested bytes (shorter at end of file)
+        """
+        chunks = []
+        i = bisect.bisect_right(self._uncompressed, offset) - 1
+        skip = offset - self._uncompressed[i]
+        while size > 0 and i < len(self._compressed):
+            data = self._block(i)[skip:skip + size]
+            chunks.append(data)
+            size -= len(data)
+            skip = 0
+            i += 1
+        return b''.join(chunks)
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice) or key.step not in (None, 1):
+            raise TypeError("BgzfFile supports contiguous slices only")
+        start = key.start or 0
+        if key.stop is None or start < 0 or key.stop < 0:
+            raise ValueError("BgzfFile slices need non-negative start and stop")
+        return self.read_at(start, max(key.stop - start, 0))
+
+
+# Test your functions
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python compressed_io.py <file>")
+        print("Example: python compressed_io.py sample.fasta")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    print(f"{filename}: {detect_compression(filename) or 'uncompressed'}")
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+FASTA Indexing
+Build a samtools-compatible .fai index and fetch records by header without
+parsing the whole file. Plain and bgzip-compressed files are supported.
+"""
+
+import mmap
+import os
+import sys
+
+from compressed_io import BgzfFile, detect_compression, open_input
+
+# Bytes read before a record's first residue when looking for its header line
+HEADER_WINDOW = 256
+
+
+def _check_indexable(filename):
+    """Return the file's compression, rejecting formats without random access."""
+    compression = detect_compression(filename)
+    if compression not in (None, "bgzf"):
+        raise ValueError(f"Cannot index {compression}-compressed FASTA: {filename} "
+                         "(recompress with bgzip)")
+    return compression
+
+
+def _record_name(header_line):
+    """Return a header line's record name as samtools does: its first word, without '>'."""
+    words = header_line[1:].split(None, 1)
+    return words[0].decode() if words else ''
+
+
+def build_fasta_index(filename, index_filename=None):
+    """
+    Scan a FASTA file once and write a .fai index next to it.
+
+    Each index line holds five tab-separated columns: record name, sequence
+    length, byte offset of the first residue, residues per line and bytes
+    per line (including the newline). As in samtools, the record name is
+    the first whitespace-delimited word of the header line without '>', so
+    names can differ from the full headers used as read_fasta() keys. For a
+    bgzipped file the offsets are into the uncompressed data, as samtools
+    writes them.
+
+    Args:
+        filename (str): Path to FASTA file
+        index_filename (str): Output path (defaults to filename + '.fai')
+
+    Returns:
+        str: Path of the written index
+
+    Raises:
+        ValueError: If a record has uneven line lengths or duplicate names,
+            which the .fai layout cannot describe, or the file is compressed
+            with something other than bgzip
+    """
+    _check_indexable(filename)
+    if index_filename is None:
+        index_filename = filename + '.fai'
+
+    entries = []
+    names = set()
+    name = None
+
+    def finish_record():
+        if name is None:
+            return
+        if name in names:
+            raise ValueError(f"Duplicate FASTA header: {name}")
+        names.add(name)
+        entries.append((name, length, offset, line_bases, line_width))
+
+    with open_input(filename, 'rb') as f:
+        position = 0
+        for raw in f:
+            line = raw.rstrip(b'\r\n')
+            if line.startswith(b'>'):
+                finish_record()
+                name = _record_name(line)
+                length = 0
+                offset = position + len(raw)
+                line_bases = line_width = 0
+                short_line_seen = False
+            elif line.strip():
+                if name is None:
+                    raise ValueError("FASTA format error: sequence found before any header.")
+                if short_line_seen:
+                    raise ValueError(f"Uneven line lengths in record '{name}'")
+                if line_bases == 0:
+                    line_bases, line_width = len(line), len(raw)
+                elif len(line) != line_bases or len(raw) != line_width:
+                    if len(line) > line_bases:
+                        raise ValueError(f"Uneven line lengths in record '{name}'")
+                    short_line_seen = True  # only the last line may be shorter
+                length += len(line)
+            elif name is not None:
+                short_line_seen = True  # blank lines may only trail a record
+            position += len(raw)
+        finish_record()
+
+    with open(index_filename, 'w') as f:
+        for entry in entries:
+            f.write("\t".join(str(column) for column in entry) + "\n")
+
+    return index_filename
+
+
+class FastaIndex:
+    """
+    Random access to the records of an indexed FASTA file.
+
+    The FASTA file is memory-mapped and only the bytes of the requested
+    range are read, so fetching a record costs the same whether the file
+    holds ten sequences or ten million. A bgzipped file is read through
+    its .gzi block index instead, inflating only the blocks that are needed.
+
+    An existing .fai (for example one written by `samtools faidx`) is
+    reused. Before a record is first fetched, the header line in front of
+    its offset is checked against the index, so an index that belongs to
+    another version of the file raises ValueError instead of returning
+    the wrong residues.
+
+    Example:
+        >>> with FastaIndex("sample.fasta") as index:
+        ...     index.fetch("hemoglobin_alpha_human", 0, 10)
+        'MVLSPADKTN'
+    """
+
+    def __init__(self, filename, index_filename=None):
+        """
+        Open a FASTA file and its index, building the index if missing.
+
+        Args:
+            filename (str): Path to FASTA file
+            index_filename (str): Path to .fai (defaults to filename + '.fai')
+        """
+        compression = _check_indexable(filename)
+        if index_filename is None:
+            index_filename = filename + '.fai'
+        if not os.path.exists(index_filename):
+            build_fasta_index(filename, index_filename)
+
+        self.filename = filename
+        self.index_filename = index_filename
+        self.entries = {}
+        self._checked = set()
+        with open(index_filename, 'r') as f:
+            for line in f:
+                name, length, offset, line_bases, line_width = line.rstrip('\n').split('\t')
+                self.entries[name] = (int(length), int(offset), int(line_bases), int(line_width))
+
+        if compression == "bgzf":
+            # BgzfFile supports the same byte slicing as the memory map
+            self._file = self._map = BgzfFile(filename)
+        else:
+            self._file = open(filename, 'rb')
+            if os.path.getsize(filename) > 0:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._map = b''
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, header):
+        return header in self.entries
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def length(self, header):
+        """Return the sequence length of a record."""
+        return self.entries[header][0]
+
+    def _check_entry(self, header):
+        """Raise ValueError unless the line before the record's offset is its header."""
+        offset = self.entries[header][1]
+        window = HEADER_WINDOW
+        while True:
+            before = self._map[max(offset - window, 0):offset].rstrip(b'\r\n')
+            newline = before.rfind(b'\n')
+            if newline >= 0 or window >= offset:
+                break
+            window *= 4
+        line = before[newline + 1:]
+        if not line.startswith(b'>') or _record_name(line) != header:
+            raise ValueError(f"Index {self.index_filename} does not match {self.filename} "
+                             f"at record '{header}' (delete the index to rebuild it)")
+        self._checked.add(header)
+
+    def _byte_position(self, header, position):
+        length, offset, line_bases, line_width = self.entries[header]
+        if line_bases == 0:
+            return offset
+        return offset + (position // line_bases) * line_width + position % line_bases
+
+    def fetch(self, header, start=None, end=None):
+        """
+        Fetch a record, or a 0-indexed half-open subrange of it.
+
+        Args:
+            header (str): Record name (first word of the header line)
+            start (int): First residue to return (default 0)
+            end (int): Residue after the last one to return (default length)
+
+        Returns:
+            str: Uppercased sequence for the requested range
+
+        Raises:
+            KeyError: If the header is not in the index
+            ValueError: If the index does not match the FASTA file
+        """
+        if header not in self.entries:
+            raise KeyError(f"Header not found in index: {header}")
+        if header not in self._checked:
+            self._check_entry(header)
+        length = self.entries[header][0]
+        start, end, _ = slice(start, end).indices(length)
+        if start >= end:
+            return ''
+
+        first = self._byte_position(header, start)
+        last = self._byte_position(header, end - 1) + 1
+        return self._map[first:last].translate(None, b'\r\n').decode().upper()
+
+    def records(self, headers=None):
+        """
+        Iterate over (header, sequence) pairs, like iter_fasta().
+
+        Args:
+            headers (iterable): Headers to fetch, in order (default: all)
+
+        Yields:
+            tuple: (header, sequence)
+        """
+        if headers is None:
+            headers = self.entries
+        for header in headers:
+            yield header, self.fetch(header)
+
+
+# Test your functions
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python fasta_index.py <fasta_file>")
+        print("Example: python fasta_index.py sample.fasta")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    index_filename = build_fasta_index(filename)
+    print(f"Index written to {index_filename}")
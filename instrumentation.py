@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Pipeline Instrumentation
+Per-stage timers and counters for the analysis pipeline, with optional
+memory tracking, written out as a JSON report.
+"""
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+_DISABLED = nullcontext()
+
+
+class Instrumentation:
+    """
+    Exclusive wall time, call counts, items, bytes and peak memory per stage.
+
+    Stages nest: while an inner stage runs, the outer one is paused, so
+    "write" does not include the time spent pulling results out of
+    "analyze", which in turn does not include "parse". Each thread keeps its
+    own stage stack, so the threaded pipeline is measured correctly too.
+
+    With track_memory, the tracemalloc peak is read and reset at every
+    stage switch. tracemalloc is process-wide, so when stages run on more
+    than one thread (as in the pipelined mode) the peaks cannot be told
+    apart; report() then gives only the overall traced peak and drops the
+    per-stage peak_memory_bytes.
+
+    When disabled, stage() returns a shared no-op context manager and
+    wrap_iter() returns its argument unchanged, so instrumented code runs
+    at full speed.
+
+    Example:
+        >>> instrumentation = Instrumentation(enabled=True)
+        >>> records = instrumentation.wrap_iter("parse", iter_fasta(filename))
+        >>> with instrumentation.stage("write"):
+        ...     write_results(analyze_sequences(records))
+        >>> instrumentation.save("profile.json")
+    """
+
+    def __init__(self, enabled=False, track_memory=False):
+        """
+        Args:
+            enabled (bool): Collect timings and counters
+            track_memory (bool): Also record peak traced memory per stage
+                with tracemalloc (slower; implies enabled)
+        """
+        self.enabled = enabled or track_memory
+        self.track_memory = track_memory
+        self.stages = {}
+        self._memory_peak = 0
+        self._threads = 0  # threads that have entered a stage
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._start = time.perf_counter()
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _stats(self, name):
+        if name not in self.stages:
+            self.stages[name] = {'seconds': 0.0, 'calls': 0, 'items': 0, 'bytes': 0}
+            if self.track_memory:
+                self.stages[name]['peak_memory_bytes'] = 0
+        return self.stages[name]
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+            with self._lock:
+                self._threads += 1
+        return self._local.stack
+
+    def _switch(self, stack, now):
+        """Charge time (and memory peak) since the last switch to the running stage."""
+        if not stack and not self.track_memory:
+            return
+        with self._lock:
+            stats = self._stats(stack[-1][0]) if stack else None
+            if stats is not None:
+                stats['seconds'] += now - stack[-1][1]
+            if self.track_memory:
+                # Read and reset under the lock so no thread's peak is lost
+                peak = tracemalloc.get_traced_memory()[1]
+                self._memory_peak = max(self._memory_peak, peak)
+                if stats is not None:
+                    stats['peak_memory_bytes'] = max(stats['peak_memory_bytes'], peak)
+                tracemalloc.reset_peak()
+
+    def _enter(self, name):
+        stack = self._stack()
+        now = time.perf_counter()
+        self._switch(stack, now)
+        stack.append((name, now))
+
+    def _exit(self):
+        stack = self._stack()
+        now = time.perf_counter()
+        self._switch(stack, now)
+        name, _ = stack.pop()
+        if stack:
+            stack[-1] = (stack[-1][0], now)
+        with self._lock:
+            self._stats(name)['calls'] += 1
+
+    @contextmanager
+    def _timed(self, name):
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def stage(self, name):
+        """Context manager that times a block as (part of) a stage."""
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+    def wrap_iter(self, name, iterable, size=None):
+        """
+        Time every step of an iterator as a stage.
+
+        Args:
+            name (str): Stage name
+            iterable (iterable): Producer to time, e.g. iter_fasta()
+            size (callable): Optional item -> bytes function for the byte counter
+
+        Returns:
+            iterable: The original iterable when disabled, else a timed generator
+        """
+        if not self.enabled:
+            return iterable
+        return self._timed_iter(name, iter(iterable), size)
+
+    def _timed_iter(self, name, iterator, size):
+        while True:
+            self._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            with self._lock:
+                stats = self._stats(name)
+                stats['items'] += 1
+                if size is not None:
+                    stats['bytes'] += size(item)
+            yield item
+
+    def add_bytes(self, name, count):
+        """Add to a stage's byte counter (e.g. the size of a written file)."""
+        if self.enabled:
+            with self._lock:
+                self._stats(name)['bytes'] += count
+
+    def report(self):
+        """Return the collected measurements as a JSON-serializable dict."""
+        stages = self.stages
+        if self.track_memory and self._threads > 1:
+            # Per-stage peaks mix allocations from every thread
+            stages = {name: {key: value for key, value in stats.items() if key != 'peak_memory_bytes'}
+                      for name, stats in stages.items()}
+        report = {
+            'total_seconds': time.perf_counter() - self._start,
+            'stages': stages,
+        }
+        if self.track_memory:
+            report['traced_memory_peak_bytes'] = self._memory_peak
+        return report
+
+    def save(self, filename):
+        """Write report() to a JSON file."""
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+K-mer Counting
+Count k-mer spectra over whole FASTA files with integer-encoded k-mers and
+NumPy, merge partial counts from several processes and build per-sequence
+k-mer vectors.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from compressed_io import detect_compression
+from read_fasta import iter_fasta, iter_fasta_range, fasta_byte_ranges
+from sequence_collection import SequenceCollection, as_collection
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+BASE = len(AMINO_ACIDS)
+# 20**14 is the largest power of 20 that fits in an int64 code
+MAX_K = 14
+# Up to this k the counts are kept in a dense 20**k array (25 MB at k=5);
+# above it only the k-mers that occur are stored, as sorted unique codes
+DENSE_MAX_K = 5
+# Residues read from a stream before each counting step
+CHUNK_RESIDUES = 1 << 22
+# Largest per-sequence vector matrix kmer_vectors() will allocate, in cells
+MAX_VECTOR_CELLS = 1 << 28
+# Work units per worker for count_kmers_parallel()
+RANGES_PER_WORKER = 4
+
+# Residue byte -> symbol index; BASE marks anything outside the alphabet
+_SYMBOLS = np.full(256, BASE, dtype=np.uint8)
+_SYMBOLS[np.frombuffer(AMINO_ACIDS.encode(), dtype=np.uint8)] = np.arange(BASE)
+
+
+def _check_k(k):
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}, got {k}")
+
+
+def encode_kmer(kmer):
+    """
+    Encode a k-mer as its base-20 integer code.
+
+    Example:
+        >>> encode_kmer("AC"), encode_kmer("CA")
+        (1, 20)
+    """
+    code = 0
+    for residue in kmer:
+        index = AMINO_ACIDS.find(residue)
+        if index < 0:
+            raise ValueError(f"Unknown amino acid: {residue}")
+        code = code * BASE + index
+    return code
+
+
+def decode_kmer(code, k):
+    """
+    Decode a base-20 integer code back to a k-mer of length k.
+
+    Example:
+        >>> decode_kmer(20, 2)
+        'CA'
+    """
+    residues = []
+    for _ in range(k):
+        code, index = divmod(int(code), BASE)
+        residues.append(AMINO_ACIDS[index])
+    return ''.join(reversed(residues))
+
+
+def _block_kmers(collection, first, last, k):
+    """
+    Encode every k-mer of records first..last-1 of a collection.
+
+    Codes are built with Horner's rule over k shifted views of the symbol
+    array (the vectorized form of a rolling base-20 hash). K-mers that
+    contain a non-standard residue or span two records are dropped.
+
+    Returns:
+        tuple: (codes, records) int64 arrays; records holds the index of
+            each k-mer's record relative to `first`
+    """
+    base = collection.offsets[first]
+    symbols = _SYMBOLS[collection.residues[base:collection.offsets[last]]]
+    n = len(symbols) - k + 1
+    if n <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    records = np.repeat(np.arange(last - first, dtype=np.int64),
+                        np.diff(collection.offsets[first:last + 1]))
+    valid = records[:n] == records[k - 1:]
+    unknown = symbols == BASE
+    if unknown.any():
+        prefix = np.zeros(len(symbols) + 1, dtype=np.int64)
+        np.cumsum(unknown, out=prefix[1:])
+        valid &= prefix[k:] == prefix[:n]
+
+    codes = np.zeros(n, dtype=np.int64)
+    for offset in range(k):
+        codes *= BASE
+        codes += symbols[offset:offset + n]
+    return codes[valid], records[:n][valid]
+
+
+def _merge_sorted(codes, counts, other_codes, other_counts):
+    """
+    Merge two sorted runs of unique codes, summing the counts of shared codes.
+
+    Each code of the second run is located in the first with one
+    np.searchsorted call, so the merge is linear apart from that search
+    rather than a fresh sort of both runs.
+    """
+    if len(other_codes) == 0:
+        return codes, counts
+    if len(codes) == 0:
+        return other_codes, other_counts
+    positions = np.searchsorted(codes, other_codes)
+    shared = codes[np.minimum(positions, len(codes) - 1)] == other_codes
+    counts = counts.copy()
+    counts[positions[shared]] += other_counts[shared]
+    new = ~shared
+    return (np.insert(codes, positions[new], other_codes[new]),
+            np.insert(counts, positions[new], other_counts[new]))
+
+
+class KmerCounts:
+    """
+    A k-mer spectrum: how often each k-mer occurs across a set of sequences.
+
+    Only k-mers that occur are stored, as a sorted int64 array of base-20
+    codes and a matching array of counts, so even k=7 spectra take a few
+    bytes per distinct k-mer rather than a Python dict entry each. Counts
+    from separate runs (for example separate processes) are combined with
+    `+` or KmerCounts.merge().
+
+    Example:
+        >>> counts = count_kmers({"p1": "ACACA"}, k=2)
+        >>> counts["AC"], counts.top(1)
+        (2, [('AC', 2)])
+    """
+
+    def __init__(self, k, codes, counts):
+        """
+        Wrap sorted unique codes and their counts; use count_kmers() instead.
+
+        Args:
+            k (int): K-mer length
+            codes (np.ndarray): Sorted unique int64 k-mer codes
+            counts (np.ndarray): int64 count per code
+        """
+        self.k = k
+        self.codes = codes
+        self.counts = counts
+
+    @classmethod
+    def empty(cls, k):
+        """Return counts with no k-mers."""
+        return cls(k, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+    @classmethod
+    def from_dense(cls, k, dense):
+        """Build counts from an array indexed by k-mer code."""
+        codes = np.flatnonzero(dense)
+        return cls(k, codes.astype(np.int64), dense[codes].astype(np.int64))
+
+    @classmethod
+    def merge(cls, parts):
+        """
+        Combine several KmerCounts with the same k into one.
+
+        Parts are merged pairwise as a balanced tree, so each k-mer takes
+        part in about log2(len(parts)) merges.
+
+        Args:
+            parts (iterable): KmerCounts objects, e.g. from worker processes
+
+        Returns:
+            KmerCounts: Summed counts
+        """
+        parts = list(parts)
+        if not parts:
+            raise ValueError("Nothing to merge")
+        k = parts[0].k
+        if any(part.k != k for part in parts):
+            raise ValueError("Cannot merge k-mer counts with different k")
+        runs = [(part.codes, part.counts) for part in parts]
+        while len(runs) > 1:
+            runs = [_merge_sorted(*runs[i], *runs[i + 1]) if i + 1 < len(runs) else runs[i]
+                    for i in range(0, len(runs), 2)]
+        return cls(k, *runs[0])
+
+    def __add__(self, other):
+        return KmerCounts.merge([self, other])
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, kmer):
+        if len(kmer) != self.k:
+            raise KeyError(f"Expected a {self.k}-mer, got {kmer!r}")
+        code = encode_kmer(kmer)
+        i = np.searchsorted(self.codes, code)
+        if i < len(self.codes) and self.codes[i] == code:
+            return int(self.counts[i])
+        return 0
+
+    @property
+    def total(self):
+        """Total number of k-mers counted."""
+        return int(self.counts.sum())
+
+    def items(self):
+        """Iterate over (k-mer, count) pairs in code order."""
+        for code, count in zip(self.codes.tolist(), self.counts.tolist()):
+            yield decode_kmer(code, self.k), count
+
+    def top(self, n=10):
+        """
+        Return the n most frequent k-mers.
+
+        Args:
+            n (int): Number of k-mers to return
+
+        Returns:
+            list: (k-mer, count) pairs, most frequent first; ties are
+                broken by k-mer code
+        """
+        n = min(n, len(self))
+        if n <= 0:
+            return []
+        # Keep every k-mer tied with the n-th count, so ties resolve by code
+        cutoff = -np.partition(-self.counts, n - 1)[n - 1]
+        best = np.flatnonzero(self.counts >= cutoff)
+        best = best[np.lexsort((self.codes[best], -self.counts[best]))][:n]
+        return [(decode_kmer(self.codes[i], self.k), int(self.counts[i])) for i in best]
+
+
+def _count_collection(collection, k):
+    """Count the k-mers of a SequenceCollection, block by block."""
+    dense = np.zeros(BASE ** k, dtype=np.int64) if k <= DENSE_MAX_K else None
+    parts = []
+    for first, last in collection._record_blocks():
+        codes, _ = _block_kmers(collection, first, last, k)
+        if dense is not None:
+            dense += np.bincount(codes, minlength=len(dense))
+        else:
+            unique, counts = np.unique(codes, return_counts=True)
+            parts.append(KmerCounts(k, unique, counts.astype(np.int64)))
+    if dense is not None:
+        return KmerCounts.from_dense(k, dense)
+    return KmerCounts.merge(parts) if parts else KmerCounts.empty(k)
+
+
+def _iter_chunks(records, chunk_residues):
+    """Group (header, sequence) pairs into SequenceCollections of about chunk_residues."""
+    chunk = []
+    size = 0
+    for record in records:
+        chunk.append(record)
+        size += len(record[1])
+        if size >= chunk_residues:
+            yield SequenceCollection.from_records(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield SequenceCollection.from_records(chunk)
+
+
+def count_kmers(sequences, k=3, chunk_residues=CHUNK_RESIDUES):
+    """
+    Count every k-mer of a set of sequences.
+
+    K-mers containing residues outside the 20 standard amino acids are
+    skipped. FASTA files and other record streams are consumed in chunks
+    of about chunk_residues residues, so memory use does not grow with
+    the input.
+
+    Args:
+        sequences: A FASTA path, a SequenceCollection, a dict of
+            header -> sequence or an iterable of (header, sequence) pairs
+        k (int): K-mer length (typically 2 to 7)
+        chunk_residues (int): Residues buffered per counting step
+
+    Returns:
+        KmerCounts: The k-mer spectrum
+    """
+    _check_k(k)
+    if isinstance(sequences, SequenceCollection):
+        return _count_collection(sequences, k)
+    if isinstance(sequences, str):
+        records = iter_fasta(sequences)
+    else:
+        records = sequences.items() if hasattr(sequences, 'items') else sequences
+
+    dense = np.zeros(BASE ** k, dtype=np.int64) if k <= DENSE_MAX_K else None
+    # Sparse partial spectra as (chunks merged, counts), merged like a binary
+    # counter: two runs are combined only when they cover the same number of
+    # chunks, so each chunk is merged O(log chunks) times in total.
+    runs = []
+    for chunk in _iter_chunks(records, chunk_residues):
+        counts = _count_collection(chunk, k)
+        if dense is not None:
+            dense[counts.codes] += counts.counts
+            continue
+        runs.append((1, counts))
+        while len(runs) > 1 and runs[-2][0] == runs[-1][0]:
+            (size, first), (_, second) = runs[-2:]
+            runs[-2:] = [(2 * size, first + second)]
+    if dense is not None:
+        return KmerCounts.from_dense(k, dense)
+    return KmerCounts.merge(counts for _, counts in runs) if runs else KmerCounts.empty(k)
+
+
+def _count_byte_range(filename, start, end, k):
+    """Worker entry point: count the k-mers of one byte range of a FASTA file."""
+    return count_kmers(iter_fasta_range(filename, start, end), k)
+
+
+def count_kmers_parallel(filename, k=3, workers=2):
+    """
+    Count the k-mers of a FASTA file on several processes.
+
+    The file is split into byte ranges on record boundaries, each worker
+    counts its own ranges and the partial spectra are merged. Compressed
+    files cannot be split and are counted in this process.
+
+    Args:
+        filename (str): Path to FASTA file
+        k (int): K-mer length
+        workers (int): Number of worker processes
+
+    Returns:
+        KmerCounts: The k-mer spectrum, equal to count_kmers(filename, k)
+    """
+    _check_k(k)
+    if workers <= 1 or detect_compression(filename) is not None:
+        return count_kmers(filename, k)
+    ranges = fasta_byte_ranges(filename, workers * RANGES_PER_WORKER)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_count_byte_range, [filename] * len(ranges),
+                              [start for start, _ in ranges], [end for _, end in ranges],
+                              [k] * len(ranges)))
+    return KmerCounts.merge(parts)
+
+
+def kmer_vectors(sequences, k=2):
+    """
+    Build a k-mer count vector for every sequence.
+
+    Args:
+        sequences: A FASTA path, a SequenceCollection, a dict of
+            header -> sequence or an iterable of (header, sequence) pairs
+        k (int): K-mer length; the vectors have 20**k columns
+
+    Returns:
+        tuple: (matrix, headers) where matrix[i, code] counts the k-mer
+            decode_kmer(code, k) in sequence headers[i]
+
+    Raises:
+        ValueError: If the matrix would exceed MAX_VECTOR_CELLS cells
+    """
+    _check_k(k)
+    collection = as_collection(sequences)
+    width = BASE ** k
+    if len(collection) * width > MAX_VECTOR_CELLS:
+        raise ValueError(f"{len(collection):,} x {width:,} k-mer matrix is too large; "
+                         "use a smaller k or fewer sequences")
+
+    matrix = np.zeros((len(collection), width), dtype=np.int32)
+    for first, last in collection._record_blocks():
+        codes, records = _block_kmers(collection, first, last, k)
+        matrix[first:last] = np.bincount(records * width + codes,
+                                          minlength=(last - first) * width).reshape(last - first, width)
+    return matrix, list(collection.keys())
+
+
+# Test your functions
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python kmer_counter.py <fasta_file> [k]")
+        print("Example: python kmer_counter.py sample.fasta 3")
+        sys.exit(1)
+
+    filename = sys.argv[1]
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    counts = count_kmers(filename, k)
+
+    print(f"{k}-mers in {filename}: {counts.total:,} total, {len(counts):,} distinct")
+    print("=" * 50)
+    for kmer, count in counts.top(10):
+        print(f"  {kmer}: {count}")
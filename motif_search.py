@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Multi-Motif Search
+Find many motifs in a single pass over a sequence with an Aho-Corasick
+automaton, and search PROSITE-style patterns with precompiled regexes.
+"""
+
+import re
+from functools import lru_cache
+
+# Compiled PROSITE patterns kept by compile_prosite()
+PATTERN_CACHE_SIZE = 1024
+
+
+class MotifSet:
+    """
+    A set of motifs compiled into an Aho-Corasick automaton.
+
+    Compiling is done once; each search then walks the sequence a single
+    time regardless of how many motifs are in the set. Positions are
+    reported in the same 0-indexed format as sequence_utils.find_motif().
+
+    Example:
+        >>> motifs = MotifSet(["AC", "CG"])
+        >>> motifs.search("ACDEFACGH")
+        {'AC': [0, 5], 'CG': [6]}
+    """
+
+    def __init__(self, motifs, overlapping=True):
+        """
+        Compile motifs into an automaton.
+
+        Args:
+            motifs (iterable): Motif strings; duplicates are ignored
+            overlapping (bool): Report overlapping hits of the same motif, as
+                find_motif() does; if False, hits are taken greedily left to
+                right and a hit may not start inside the previous one
+        """
+        self.motifs = list(dict.fromkeys(motifs))
+        self.overlapping = overlapping
+        self._build()
+
+    def __len__(self):
+        return len(self.motifs)
+
+    def __iter__(self):
+        return iter(self.motifs)
+
+    def _build(self):
+        # Trie: one transition dict and one output list per node
+        transitions = [{}]
+        outputs = [[]]
+        for index, motif in enumerate(self.motifs):
+            if not motif:
+                continue  # the empty motif matches everywhere; handled in search()
+            node = 0
+            for char in motif:
+                if char not in transitions[node]:
+                    transitions.append({})
+                    outputs.append([])
+                    transitions[node][char] = len(transitions) - 1
+                node = transitions[node][char]
+            outputs[node].append(index)
+
+        # Breadth-first pass to fill in failure links, then turn the trie
+        # into a complete automaton so the search never backtracks.
+        alphabet = set(''.join(self.motifs))
+        fail = [0] * len(transitions)
+        queue = list(transitions[0].values())
+        for node in queue:
+            for char, child in transitions[node].items():
+                queue.append(child)
+                fallback = fail[node]
+                while fallback and char not in transitions[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = transitions[fallback].get(char, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+
+        for node in queue:
+            for char in alphabet:
+                if char not in transitions[node]:
+                    transitions[node][char] = transitions[fail[node]].get(char, 0)
+
+        self._transitions = transitions
+        self._outputs = outputs
+        self._lengths = [len(motif) for motif in self.motifs]
+
+    def search(self, seq):
+        """
+        Find all occurrences of every motif in a sequence.
+
+        Args:
+            seq (str): Sequence to search
+
+        Returns:
+            dict: Motif -> list of starting positions (0-indexed)
+        """
+        hits = [[] for _ in self.motifs]
+        transitions = self._transitions
+        outputs = self._outputs
+        lengths = self._lengths
+
+        node = 0
+        for end, char in enumerate(seq, 1):
+            node = transitions[node].get(char, 0)
+            for index in outputs[node]:
+                hits[index].append(end - lengths[index])
+
+        for index, length in enumerate(lengths):
+            if length == 0:
+                hits[index] = list(range(len(seq) + 1))
+
+        if not self.overlapping:
+            hits = [_drop_overlaps(positions, length)
+                    for positions, length in zip(hits, lengths)]
+
+        return {motif: sorted(positions) for motif, positions in zip(self.motifs, hits)}
+
+    def count(self, seq):
+        """
+        Count occurrences of every motif in a sequence.
+
+        Args:
+            seq (str): Sequence to search
+
+        Returns:
+            dict: Motif -> number of hits
+        """
+        return {motif: len(positions) for motif, positions in self.search(seq).items()}
+
+
+def _drop_overlaps(positions, length):
+    """Keep hits greedily from the left, skipping any that overlap the last kept hit."""
+    kept = []
+    next_free = 0
+    for position in sorted(positions):
+        if position >= next_free:
+            kept.append(position)
+            next_free = position + max(length, 1)
+    return kept
+
+
+def _prosite_element(element):
+    """Translate one PROSITE element (without repetition) to a regex."""
+    if element == 'x':
+        return '.'
+    if element.startswith('[') and element.endswith(']'):
+        residues = element[1:-1]
+        if '>' in residues:
+            # [G>] means G or the C-terminus
+            return f"(?:[{residues.replace('>', '')}]|$)"
+        return f"[{residues}]"
+    if element.startswith('{') and element.endswith('}'):
+        return f"[^{element[1:-1]}]"
+    if re.fullmatch(r'[A-Z]', element):
+        return element
+    raise ValueError(f"Invalid PROSITE element: {element!r}")
+
+
+def prosite_to_regex(pattern):
+    """
+    Translate a PROSITE pattern into an equivalent regular expression.
+
+    Supported syntax: residues (N), any residue (x), residue classes ([ST]),
+    excluded residues ({P}), repetition (x(2), x(2,4)), N- and C-terminal
+    anchors (<, >) and an optional trailing period.
+
+    Args:
+        pattern (str): PROSITE pattern such as "N-{P}-[ST]-{P}"
+
+    Returns:
+        str: Regular expression matching the same residues
+
+    Raises:
+        ValueError: If the pattern cannot be parsed
+
+    Example:
+        >>> prosite_to_regex("N-{P}-[ST]-x(2)")
+        'N[^P][ST].{2}'
+    """
+    pattern = pattern.strip().rstrip('.')
+    regex = ''
+    if pattern.startswith('<'):
+        regex += '^'
+        pattern = pattern[1:]
+    suffix = ''
+    if pattern.endswith('>') and not pattern.endswith(']'):
+        suffix = '$'
+        pattern = pattern[:-1]
+
+    for part in pattern.split('-'):
+        match = re.fullmatch(r'(.+?)(?:\((\d+)(?:,(\d+))?\))?', part)
+        if not part or match is None:
+            raise ValueError(f"Invalid PROSITE pattern: {pattern!r}")
+        element, low, high = match.groups()
+        regex += _prosite_element(element)
+        if high is not None:
+            regex += f"{{{low},{high}}}"
+        elif low is not None:
+            regex += f"{{{low}}}"
+
+    return regex + suffix
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_prosite(pattern):
+    """
+    Compile a PROSITE pattern into a matcher that finds overlapping hits.
+
+    Results are cached, so looking up the same pattern for millions of
+    sequences compiles it only once.
+
+    Args:
+        pattern (str): PROSITE pattern
+
+    Returns:
+        re.Pattern: Regex whose match starts are the pattern positions
+    """
+    # A zero-width lookahead lets the scan resume one residue later,
+    # so overlapping hits are reported like find_motif() does.
+    return re.compile(f"(?=({prosite_to_regex(pattern)}))")
+
+
+def find_pattern(seq, pattern):
+    """
+    Find all starting positions of a PROSITE pattern in a sequence.
+
+    Args:
+        seq (str): Protein sequence to search
+        pattern (str): PROSITE pattern such as "N-{P}-[ST]-{P}"
+
+    Returns:
+        list: List of starting positions (0-indexed) where the pattern matches
+
+    Example:
+        >>> find_pattern("MNKSANPT", "N-{P}-[ST]")
+        [1]
+    """
+    return [match.start() for match in compile_prosite(pattern).finditer(seq)]
+
+
+# Test your functions
+if __name__ == "__main__":
+    print("Testing Multi-Motif Search")
+    print("=" * 50)
+
+    test_seq = "MVHLTPEEKSAVTALWGKVNVDEVGGEALGRLLVVYPWTQRFFESFGDLSTPDAVMGNPKVKAHGKKVLGAFSDGLAHLDNLKGTFATLSELHCDKLHVDPENFRLLGNVLVCVLAHHFGKEFTPPVQAAYQKVVAGVANALAHKYH"
+    motifs = MotifSet(["LV", "VL", "GK", "AH"])
+    print(f"Searching for motifs {motifs.motifs} in: {test_seq[:50]}...")
+    for motif, positions in motifs.search(test_seq).items():
+        print(f"  {motif}: {positions}")
+
+    pattern = "N-{P}-[ST]-{P}"
+    print(f"\nSearching for PROSITE pattern {pattern} (N-glycosylation site)")
+    print(f"  Regex: {prosite_to_regex(pattern)}")
+    print(f"  Positions: {find_pattern(test_seq, pattern)}")
+
+    print("\n" + "=" * 50)
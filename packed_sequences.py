@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Packed Sequence Encoding
+Store protein sequences in 5 bits per residue and DNA in 2 bits per base,
+with vectorized packing, unpacking and metrics computed on packed data.
+Symbols outside the alphabet, such as runs of N in DNA, are kept as
+exception runs in the manner of the UCSC .2bit format.
+"""
+
+import sys
+
+import numpy as np
+
+import sequence_utils
+from sequence_collection import SequenceCollection
+
+# 20 standard amino acids plus the common ambiguity and special codes;
+# at most 32 symbols fit in 5 bits
+PROTEIN_ALPHABET = "ACDEFGHIKLMNPQRSTVWYBZXUO*-"
+DNA_ALPHABET = "ACGT"
+# Residues unpacked at a time when scanning packed data
+BLOCK_RESIDUES = 1 << 20
+
+
+def bits_for(alphabet):
+    """Return the number of bits needed per symbol of an alphabet."""
+    return max(1, (len(alphabet) - 1).bit_length())
+
+
+class PackedSequence:
+    """
+    A sequence packed into a fixed number of bits per symbol.
+
+    Symbol i of the alphabet is stored as the integer i, most significant
+    bit first, so a protein takes 5/8 and a DNA sequence 2/8 of the memory
+    of one byte per residue. Like the N blocks of a .2bit file, runs of a
+    symbol outside the alphabet are stored separately as (start, length,
+    symbol) exceptions and hold code 0 in the packed bits; unpack() and
+    byte_histogram() restore them.
+
+    Example:
+        >>> packed = PackedSequence.pack("ACGTNNNNAC", DNA_ALPHABET)
+        >>> packed.data.nbytes, packed.unpack(), packed.exception_lengths.tolist()
+        (3, 'ACGTNNNNAC', [4])
+    """
+
+    def __init__(self, data, length, alphabet=PROTEIN_ALPHABET, exceptions=None):
+        """
+        Wrap already packed data; use pack() to encode a sequence.
+
+        Args:
+            data (np.ndarray): uint8 packed bits
+            length (int): Number of symbols stored
+            alphabet (str): Symbols in code order
+            exceptions (tuple): Optional (starts, lengths, symbols) arrays of
+                sorted, non-overlapping runs of symbols outside the alphabet
+        """
+        self.data = data
+        self.length = length
+        self.alphabet = alphabet
+        self.bits = bits_for(alphabet)
+        self._symbols = np.frombuffer(alphabet.encode(), dtype=np.uint8)
+        if exceptions is None:
+            exceptions = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+                          np.zeros(0, dtype=np.uint8))
+        self.exception_starts, self.exception_lengths, self.exception_symbols = exceptions
+        self._exception_ends = self.exception_starts + self.exception_lengths
+
+    @classmethod
+    def pack(cls, sequence, alphabet=PROTEIN_ALPHABET):
+        """
+        Pack a sequence.
+
+        Args:
+            sequence (str or np.ndarray): Sequence text or uint8 ASCII codes
+            alphabet (str): Symbols in code order (PROTEIN_ALPHABET or DNA_ALPHABET)
+
+        Returns:
+            PackedSequence: The packed sequence; symbols outside the
+                alphabet become exception runs
+        """
+        if isinstance(sequence, str):
+            sequence = np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)
+        bits = bits_for(alphabet)
+        lookup = np.full(256, 255, dtype=np.uint8)
+        lookup[np.frombuffer(alphabet.encode(), dtype=np.uint8)] = np.arange(len(alphabet))
+
+        chunks = []
+        runs = []
+        for start in range(0, len(sequence), BLOCK_RESIDUES * 8):
+            # Blocks are a multiple of 8 residues so each ends on a byte boundary
+            block = sequence[start:start + BLOCK_RESIDUES * 8]
+            codes = lookup[block]
+            outside = codes == 255
+            if outside.any():
+                runs.append(_symbol_runs(block, np.flatnonzero(outside), start))
+                codes[outside] = 0
+            code_bits = np.unpackbits(codes[:, None], axis=1)[:, 8 - bits:]
+            chunks.append(np.packbits(code_bits.reshape(-1)))
+        data = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.uint8)
+        exceptions = None
+        if runs:
+            exceptions = _join_runs(*(np.concatenate(part) for part in zip(*runs)))
+        return cls(data, len(sequence), alphabet, exceptions)
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def nbytes(self):
+        """Bytes used by the packed data and the exception runs."""
+        return (self.data.nbytes + self.exception_starts.nbytes
+                + self.exception_lengths.nbytes + self.exception_symbols.nbytes)
+
+    def _exceptions_in(self, start, end):
+        """Return (starts, lengths, symbols) of the exception runs clipped to a range."""
+        first = np.searchsorted(self._exception_ends, start, side='right')
+        last = np.searchsorted(self.exception_starts, end, side='left')
+        starts = np.maximum(self.exception_starts[first:last], start)
+        ends = np.minimum(self._exception_ends[first:last], end)
+        return starts, ends - starts, self.exception_symbols[first:last]
+
+    def codes(self, start=0, end=None):
+        """
+        Extract the integer codes of a range of symbols.
+
+        Only the bytes covering the range are unpacked. Exception runs
+        read as code 0.
+
+        Args:
+            start (int): First symbol
+            end (int): Symbol after the last one (default: end of sequence)
+
+        Returns:
+            np.ndarray: uint8 codes, one per symbol
+        """
+        if end is None:
+            end = self.length
+        if start >= end:
+            return np.zeros(0, dtype=np.uint8)
+        first_bit = start * self.bits
+        last_bit = end * self.bits
+        raw = self.data[first_bit // 8:(last_bit + 7) // 8]
+        bits = np.unpackbits(raw)[first_bit % 8:first_bit % 8 + last_bit - first_bit]
+        padded = np.zeros((end - start, 8), dtype=np.uint8)
+        padded[:, 8 - self.bits:] = bits.reshape(-1, self.bits)
+        return np.packbits(padded, axis=1).reshape(-1)
+
+    def unpack(self, start=0, end=None):
+        """Decode a range of symbols (default: all) back to a string."""
+        if end is None:
+            end = self.length
+        text = self._symbols[self.codes(start, end)]
+        starts, lengths, symbols = self._exceptions_in(start, end)
+        if len(starts):
+            # Position of every excepted symbol, built run by run with repeat()
+            run_offsets = np.repeat(starts - start - (np.cumsum(lengths) - lengths), lengths)
+            text[run_offsets + np.arange(lengths.sum())] = np.repeat(symbols, lengths)
+        return text.tobytes().decode()
+
+    def histogram(self, start=0, end=None):
+        """
+        Count each alphabet symbol in a range, working block by block.
+
+        Exception runs are not counted; byte_histogram() includes them.
+
+        Returns:
+            np.ndarray: One count per alphabet symbol, in alphabet order
+        """
+        if end is None:
+            end = self.length
+        counts = np.zeros(len(self.alphabet), dtype=np.int64)
+        for block in range(start, end, BLOCK_RESIDUES):
+            codes = self.codes(block, min(block + BLOCK_RESIDUES, end))
+            counts += np.bincount(codes, minlength=len(self.alphabet))
+        counts[0] -= self._exceptions_in(start, end)[1].sum()
+        return counts
+
+    def byte_histogram(self, start=0, end=None):
+        """Symbol counts, exception runs included, as a 256-entry histogram by ASCII code."""
+        if end is None:
+            end = self.length
+        counts = np.zeros(256, dtype=np.int64)
+        counts[self._symbols] = self.histogram(start, end)
+        _, lengths, symbols = self._exceptions_in(start, end)
+        np.add.at(counts, symbols, lengths)
+        return counts
+
+
+def _symbol_runs(block, positions, offset):
+    """Group positions of a block into runs of one repeated symbol."""
+    symbols = block[positions]
+    new_run = np.ones(len(positions), dtype=bool)
+    new_run[1:] = (np.diff(positions) != 1) | (symbols[1:] != symbols[:-1])
+    firsts = np.flatnonzero(new_run)
+    lengths = np.diff(np.append(firsts, len(positions)))
+    return positions[firsts].astype(np.int64) + offset, lengths.astype(np.int64), symbols[firsts]
+
+
+def _join_runs(starts, lengths, symbols):
+    """Merge runs that continue one another, e.g. across block boundaries."""
+    continues = np.zeros(len(starts), dtype=bool)
+    continues[1:] = (starts[1:] == starts[:-1] + lengths[:-1]) & (symbols[1:] == symbols[:-1])
+    firsts = np.flatnonzero(~continues)
+    return starts[firsts], np.add.reduceat(lengths, firsts), symbols[firsts]
+
+
+class PackedCollection:
+    """
+    A SequenceCollection whose residues are stored packed.
+
+    Headers and offsets are kept as in SequenceCollection; the residue
+    buffer is replaced by a single PackedSequence. Metrics are computed from
+    symbol histograms of the packed data, so sequences are never decoded
+    back to strings for analysis.
+
+    Example:
+        >>> packed = PackedCollection.from_fasta("sample.fasta")
+        >>> packed.metrics(0) == sequence_utils.sequence_metrics(packed[0])
+        True
+    """
+
+    def __init__(self, packed, offsets, header_bytes, header_offsets):
+        self.packed = packed
+        self.offsets = offsets
+        self.header_bytes = header_bytes
+        self.header_offsets = header_offsets
+
+    @classmethod
+    def from_collection(cls, collection, alphabet=PROTEIN_ALPHABET):
+        """Pack the residues of a SequenceCollection."""
+        residues = collection.residues[collection.offsets[0]:collection.offsets[-1]]
+        return cls(PackedSequence.pack(residues, alphabet), collection.offsets - collection.offsets[0],
+                   collection.header_bytes, collection.header_offsets)
+
+    @classmethod
+    def from_fasta(cls, filename, alphabet=PROTEIN_ALPHABET):
+        """Read and pack every record of a FASTA file."""
+        return cls.from_collection(SequenceCollection.from_fasta(filename), alphabet)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        index = range(len(self))[index]
+        return self.packed.unpack(int(self.offsets[index]), int(self.offsets[index + 1]))
+
+    def __iter__(self):
+        return self.keys()
+
+    @property
+    def nbytes(self):
+        """Bytes used by packed residues, headers and offsets."""
+        return (self.packed.nbytes + self.offsets.nbytes
+                + self.header_bytes.nbytes + self.header_offsets.nbytes)
+
+    def header(self, index):
+        """Return the header of record `index`."""
+        index = range(len(self))[index]
+        start, end = self.header_offsets[index], self.header_offsets[index + 1]
+        return self.header_bytes[start:end].tobytes().decode()
+
+    def keys(self):
+        """Iterate over headers, in order."""
+        for i in range(len(self)):
+            yield self.header(i)
+
+    def items(self):
+        """Iterate over (header, sequence) pairs, decoding each sequence."""
+        for i in range(len(self)):
+            yield self.header(i), self[i]
+
+    def metrics(self, index):
+        """
+        Compute sequence_metrics() for a record directly from packed data.
+
+        Raises:
+            ValueError: If the record contains a residue without a known weight
+        """
+        index = range(len(self))[index]
+        start, end = int(self.offsets[index]), int(self.offsets[index + 1])
+        metrics, unknown = sequence_utils._metrics_from_histogram(
+            self.packed.byte_histogram(start, end), end - start)
+        if unknown:
+            # Decode only on the error path, to report the first bad residue
+            sequence = self[index]
+            sequence_utils._raise_unknown(sequence, np.frombuffer(sequence.encode(), dtype=np.uint8))
+        return metrics
+
+    def analyze(self):
+        """Return analyze_sequences()-style results for every record."""
+        return {self.header(i): self.metrics(i) for i in range(len(self))}
+
+
+# Test your functions
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python packed_sequences.py <fasta_file> [protein|dna]")
+        print("Example: python packed_sequences.py sample.fasta")
+        sys.exit(1)
+
+    alphabet = DNA_ALPHABET if sys.argv[2:] == ["dna"] else PROTEIN_ALPHABET
+    collection = SequenceCollection.from_fasta(sys.argv[1])
+    packed = PackedCollection.from_collection(collection, alphabet)
+    print(f"Residues: {len(collection.residues):,} bytes unpacked, "
+          f"{packed.packed.nbytes:,} bytes packed ({packed.packed.bits} bits/residue)")
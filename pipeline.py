@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Pipelined Analysis
+Overlap reading, computing and writing by running each stage in its own
+thread, connected by bounded queues.
+"""
+
+import queue
+import threading
+
+from read_fasta import iter_fasta
+from analyze_sequence import iter_analyze_sequences, _chunk_records, _record_size
+from instrumentation import Instrumentation
+
+# Chunks waiting between two stages; a full queue blocks the stage before
+# it, which bounds memory to a few chunks per queue.
+QUEUE_CHUNKS = 4
+# Residues per chunk handed from the reader to the compute stage
+PIPELINE_CHUNK_RESIDUES = 250_000
+# Results per batch handed from the compute stage to the writer
+RESULT_BATCH = 1000
+# Seconds a blocked stage waits on a queue before checking for a stop request
+POLL_INTERVAL = 0.1
+
+_DONE = object()
+
+
+class _StageError:
+    """Carries an exception from a stage thread to the consumer."""
+
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(output, item, stop):
+    """Put item on a queue, giving up if stop is set; returns whether it was put."""
+    while not stop.is_set():
+        try:
+            output.put(item, timeout=POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _run_stage(produce, output, stop):
+    """
+    Put every item from produce() on the output queue, then _DONE.
+
+    If stop is set (the consumer went away), the producer is closed so
+    that anything it owns, such as a process pool, is shut down.
+    """
+    items = produce()
+    try:
+        for item in items:
+            if not _put(output, item, stop):
+                return
+    except BaseException as e:
+        _put(output, _StageError(e), stop)
+    else:
+        _put(output, _DONE, stop)
+    finally:
+        items.close()
+
+
+def _drain(source, stop):
+    """Yield items from a queue until _DONE or stop, re-raising stage errors."""
+    while not stop.is_set():
+        try:
+            item = source.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            continue
+        if item is _DONE:
+            return
+        if isinstance(item, _StageError):
+            raise item.error
+        yield item
+
+
+def _batched(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_pipelined(records, workers=1, motifs=None, cache=None, queue_chunks=QUEUE_CHUNKS,
+                   instrumentation=None):
+    """
+    Analyze records with reading and computing running in background threads.
+
+    The reader thread pulls records from `records` (typically iter_fasta())
+    and the compute thread runs iter_analyze_sequences() on them, while the
+    caller consumes results, usually by writing them out. Each stage blocks
+    when the next one falls behind, so memory stays bounded and the total
+    time approaches that of the slowest stage rather than the sum. If the
+    caller stops early (or a stage fails), both threads are told to stop
+    and are joined when the generator is closed.
+
+    Args:
+        records (iterable): (header, sequence) pairs
+        workers (int): Worker processes for the compute stage
+        motifs (iterable or MotifSet): Optional motifs, as analyze_sequences()
+        cache (ResultCache): Optional result cache, as analyze_sequences()
+        queue_chunks (int): Maximum chunks waiting between two stages
+        instrumentation (Instrumentation): Optional; times the compute
+            thread as the "analyze" stage
+
+    Yields:
+        tuple: (header, metrics) in input order
+    """
+    instrumentation = instrumentation or Instrumentation()
+    chunks = queue.Queue(maxsize=queue_chunks)
+    batches = queue.Queue(maxsize=queue_chunks)
+    stop = threading.Event()
+
+    def read():
+        return _chunk_records(records, PIPELINE_CHUNK_RESIDUES)
+
+    def compute():
+        sequences = (record for chunk in _drain(chunks, stop) for record in chunk)
+        analyzed = iter_analyze_sequences(sequences, workers=workers, motifs=motifs, cache=cache)
+        return _batched(instrumentation.wrap_iter("analyze", analyzed), RESULT_BATCH)
+
+    stages = [threading.Thread(target=_run_stage, args=(read, chunks, stop), daemon=True),
+              threading.Thread(target=_run_stage, args=(compute, batches, stop), daemon=True)]
+    for stage in stages:
+        stage.start()
+
+    try:
+        for batch in _drain(batches, stop):
+            yield from batch
+    finally:
+        stop.set()
+        for stage in stages:
+            stage.join()
+
+
+def iter_pipelined_fasta(filename, workers=1, motifs=None, cache=None,
+                         queue_chunks=QUEUE_CHUNKS, progress=None, instrumentation=None):
+    """Run iter_pipelined() over every record of a FASTA file, timing "parse" too."""
+    instrumentation = instrumentation or Instrumentation()
+    records = instrumentation.wrap_iter("parse", iter_fasta(filename, progress), _record_size)
+    return iter_pipelined(records, workers, motifs, cache, queue_chunks, instrumentation)
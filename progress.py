@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Progress Reporting
+Show records/s, residues/s, bytes read and ETA for long analysis runs,
+redrawn at most a few times per second.
+"""
+
+import sys
+import time
+
+# Seconds between progress redraws
+REPORT_INTERVAL = 0.5
+
+
+def _format_duration(seconds):
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+
+
+class ProgressReporter:
+    """
+    Throughput and ETA display for a streaming run.
+
+    Call update() once per analyzed record; the line on `stream` is only
+    redrawn every `interval` seconds, so the cost per record is a counter
+    increment and a clock read. Bytes read are counted by wrapping the
+    input lines with track_lines() or by calling add_bytes().
+
+    Example:
+        >>> progress = ProgressReporter(total_bytes=os.path.getsize(filename))
+        >>> for header, metrics in iter_analyze_fasta(filename, progress=progress):
+        ...     progress.update(metrics['length'])
+        >>> progress.finish()
+    """
+
+    def __init__(self, total_bytes=None, interval=REPORT_INTERVAL, stream=None):
+        """
+        Args:
+            total_bytes (int): Input size, used for the ETA (optional)
+            interval (float): Minimum seconds between redraws
+            stream (file): Where to draw (default: sys.stderr)
+        """
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.records = 0
+        self.residues = 0
+        self.bytes_read = 0
+        self.start = time.monotonic()
+        self._next_report = self.start + interval
+
+    def track_lines(self, lines):
+        """Yield lines unchanged while counting their size as bytes read."""
+        for line in lines:
+            self.bytes_read += len(line)
+            yield line
+
+    def add_bytes(self, count):
+        """Count input bytes consumed elsewhere (e.g. by worker processes)."""
+        self.bytes_read += count
+
+    def update(self, residues=0, records=1):
+        """Count analyzed records and redraw if the interval has passed."""
+        self.records += records
+        self.residues += residues
+        now = time.monotonic()
+        if now >= self._next_report:
+            self._next_report = now + self.interval
+            self.report(now)
+
+    def status(self, now=None):
+        """Return the current progress line."""
+        elapsed = max((now or time.monotonic()) - self.start, 1e-9)
+        line = (f"{self.records:,} records ({self.records / elapsed:,.0f}/s), "
+                f"{self.residues / elapsed:,.0f} residues/s, "
+                f"{self.bytes_read / 1e6:,.1f} MB read")
+        if self.total_bytes and self.bytes_read:
+            remaining = max(self.total_bytes - self.bytes_read, 0)
+            eta = remaining / (self.bytes_read / elapsed)
+            line += f" of {self.total_bytes / 1e6:,.1f} MB, ETA {_format_duration(eta)}"
+        return line
+
+    def report(self, now=None):
+        """Redraw the progress line in place."""
+        self.stream.write("\r" + self.status(now) + "\033[K")
+        self.stream.flush()
+
+    def finish(self):
+        """Draw the final totals and end the progress line."""
+        self.report()
+        self.stream.write(f" in {_format_duration(time.monotonic() - self.start)}\n")
+        self.stream.flush()
@@ -4,13 +4,228 @@ HW3 Part 3: FASTA File Parsing
 Implement functions to read and parse FASTA files.
 """
 
+import os
+import string
 import sys
 
+from compressed_io import detect_compression, open_input
+
+# Bytes read per call by iter_fasta_bytes()
+BLOCK_SIZE = 1 << 24
+# Uppercases ASCII letters in one bytes.translate() call
+_UPPERCASE = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+_WHITESPACE = string.whitespace.encode()
+
+
+def iter_fasta(filename, progress=None):
+    """
+    Iterate over the records of a FASTA file one at a time.
+
+    Only the record currently being assembled is held in memory, so files
+    far larger than RAM can be processed as long as each single record fits.
+    gzip, bgzip and zstd files are decompressed on the fly.
+
+    Args:
+        filename (str): Path to FASTA file
+        progress (ProgressReporter): Optional reporter that counts bytes read
+
+    Yields:
+        tuple: (header, sequence) with the header stripped of '>' and the
+            sequence joined across lines and uppercased
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If sequence data appears before the first header
+
+    Example:
+        >>> for header, seq in iter_fasta("sample.fasta"):
+        ...     print(header, len(seq))
+    """
+    with open_input(filename, 'r') as f:
+        lines = f if progress is None else progress.track_lines(f)
+        yield from _parse_fasta_lines(lines)
+
+
+def _parse_fasta_lines(lines):
+    """Assemble (header, sequence) records from an iterable of FASTA lines."""
+    current_header = None
+    chunks = []
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue  # skip blank lines
+        if line.startswith('>'):
+            if current_header is not None:
+                yield current_header, ''.join(chunks).upper()
+            current_header = line[1:].strip()
+            chunks = []
+        else:
+            if current_header is None:
+                raise ValueError("FASTA format error: sequence found before any header.")
+            # Collect lines and join once per record; repeated string
+            # concatenation copies the growing sequence on every line.
+            chunks.append(line)
+
+    if current_header is not None:
+        yield current_header, ''.join(chunks).upper()
+
+
+def _parse_record_bytes(record, as_str):
+    """Split one '>'-prefixed record into header and cleaned sequence."""
+    newline = record.find(b'\n')
+    if newline == -1:
+        newline = len(record)
+    header = record[1:newline].strip()
+    sequence = record[newline + 1:].translate(_UPPERCASE, _WHITESPACE)
+    if as_str:
+        return header.decode(), sequence.decode()
+    return header, sequence
+
+
+def iter_fasta_bytes(filename, as_str=False, block_size=BLOCK_SIZE):
+    """
+    Iterate over FASTA records using a block-based binary parser.
+
+    The file is read in large blocks without text decoding. Record
+    boundaries are located with bytes.find(), and each record's newlines
+    and other whitespace are removed and its letters uppercased with a
+    single bytes.translate() call, instead of strip()/upper() per line.
+    Unlike iter_fasta(), whitespace inside a sequence line is removed too.
+    Compressed files are handled as in iter_fasta().
+
+    Args:
+        filename (str): Path to FASTA file
+        as_str (bool): Return str instead of bytes for header and sequence
+        block_size (int): Bytes read per call
+
+    Yields:
+        tuple: (header, sequence) as bytes (or str if as_str)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If sequence data appears before the first header
+    """
+    pending = []  # pieces of the record that continues into the next block
+    after_newline = True  # the start of the file counts as a line start
+
+    with open_input(filename, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            starts = []
+            if after_newline and block.startswith(b'>'):
+                starts.append(0)
+            position = block.find(b'\n>')
+            while position != -1:
+                starts.append(position + 1)
+                position = block.find(b'\n>', position + 1)
+            after_newline = block.endswith(b'\n')
+
+            if not starts:
+                pending.append(block)
+                continue
+
+            pending.append(block[:starts[0]])
+            yield from _finish_pending(pending, as_str)
+            for start, end in zip(starts, starts[1:]):
+                yield _parse_record_bytes(block[start:end], as_str)
+            pending = [block[starts[-1]:]]
+
+    yield from _finish_pending(pending, as_str)
+
+
+def _finish_pending(pending, as_str):
+    """Parse the buffered record, if any; text before the first header must be blank."""
+    data = b''.join(pending)
+    if data.startswith(b'>'):
+        yield _parse_record_bytes(data, as_str)
+    elif data.strip():
+        raise ValueError("FASTA format error: sequence found before any header.")
+
+
+def fasta_byte_ranges(filename, n_ranges, max_range_bytes=None):
+    """
+    Split a FASTA file into roughly equal byte ranges on record boundaries.
+
+    Each range starts at a header line, so the ranges can be parsed
+    independently (for example by separate worker processes) with
+    iter_fasta_range(). Offsets are into the file as stored, so the file
+    must be uncompressed.
+
+    Args:
+        filename (str): Path to FASTA file
+        n_ranges (int): Desired number of ranges; fewer are returned when the
+            file has fewer records than that
+        max_range_bytes (int): Optional cap on the size of a range; more
+            than n_ranges ranges are made when the file is large
+
+    Returns:
+        list: (start, end) byte offsets covering the whole file
+
+    Raises:
+        ValueError: If the file is compressed
+    """
+    if detect_compression(filename) is not None:
+        raise ValueError(f"Byte ranges need an uncompressed FASTA file: {filename}")
+    size = os.path.getsize(filename)
+    if max_range_bytes:
+        n_ranges = max(n_ranges, -(-size // max_range_bytes))
+    boundaries = [0]
+
+    with open(filename, 'rb') as f:
+        for i in range(1, max(n_ranges, 1)):
+            target = max(size * i // n_ranges, boundaries[-1])
+            f.seek(target)
+            if target > 0:
+                f.readline()  # skip the partial line we landed in
+            position = f.tell()
+            for line in iter(f.readline, b''):
+                if line.startswith(b'>'):
+                    break
+                position += len(line)
+            if position < size and position > boundaries[-1]:
+                boundaries.append(position)
+
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def iter_fasta_range(filename, start, end):
+    """
+    Iterate over the records stored in one byte range of a FASTA file.
+
+    Lines are read one at a time, so memory use does not grow with the
+    size of the range.
+
+    Args:
+        filename (str): Path to FASTA file
+        start (int): Byte offset of a header line (or 0)
+        end (int): Byte offset where the range stops
+
+    Yields:
+        tuple: (header, sequence), as iter_fasta()
+    """
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        yield from _parse_fasta_lines(_iter_range_lines(f, end - start))
+
+
+def _iter_range_lines(f, size):
+    """Yield decoded lines from a binary file until size bytes have been read."""
+    while size > 0:
+        line = f.readline(size)
+        if not line:
+            return
+        size -= len(line)
+        yield line.decode()
+
 
 def read_fasta(filename):
     """
     Read a FASTA file and return a dictionary of sequences.
 
+    This is a thin wrapper around iter_fasta() that collects every record;
+    prefer iter_fasta() for files that do not fit comfortably in memory.
+
     FASTA format:
         >header1
         SEQUENCE1
@@ -32,31 +247,8 @@ def read_fasta(filename):
 
         Returns: {'protein1': 'ACDEFG', 'protein2': 'HIKLMN'}
     """
-    sequences = {}
-
-    # TODO: Implement this function
-    # Hints:
-    # 1. Open the file and read it line by line
-    # 2. Lines starting with '>' are headers
-    # 3. Other lines are sequence data (might be split across multiple lines)
-    # 4. Use .strip() to remove whitespace/newlines
-    # 5. Store sequences in the dictionary with header as key
-
     try:
-        # TODO: Open and parse the file
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue  # skip blank lines
-                if line.startswith('>'):
-                    current_header = line[1:].strip()
-                    sequences[current_header] = ''
-                else:
-                    if current_header is None:
-                        raise ValueError("FASTA format error: sequence found before any header.")
-                    sequences[current_header] += line.upper()  # combine multi-line sequences
-        return sequences
+        return dict(iter_fasta(filename))
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found!")
         return {}
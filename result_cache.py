@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Analysis Result Cache
+Store per-sequence analysis results on disk, keyed by a hash of the
+sequence, so unchanged sequences are not recomputed on the next run.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+
+from sequence_utils import METRICS_VERSION
+
+# Default maximum number of cached results before the least recently used
+# entries are evicted
+DEFAULT_MAX_ENTRIES = 10_000_000
+# Rows allowed beyond max_entries during a run, as a fraction of it, before
+# put_many() evicts back down to max_entries
+EVICT_SLACK = 0.05
+# SQLite limits the number of parameters in one statement
+_QUERY_BATCH = 500
+
+
+class ResultCache:
+    """
+    Size-bounded, least-recently-used cache of analysis results in SQLite.
+
+    The row count is tracked as results are stored, and once it passes
+    max_entries by EVICT_SLACK, put_many() evicts the least recently used
+    results back down to max_entries, so the file stays bounded during
+    long runs without a COUNT query per batch. close() evicts down to
+    max_entries exactly.
+
+    Keys are SHA-256 hashes of the sequence together with METRICS_VERSION
+    and the motif settings, so results computed by an older version of the
+    metrics or for other motifs are never reused.
+
+    Example:
+        >>> with ResultCache("analysis_cache.sqlite") as cache:
+        ...     results = analyze_sequences(sequences, cache=cache)
+        ...     print(cache.summary())
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path (str): SQLite database file
+            max_entries (int): Maximum number of results kept on disk
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # The connection may be handed to a pipeline thread; only one thread uses it at a time
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used INTEGER NOT NULL)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        # Upper bound on the row count; replaced rows are counted as new
+        self._count = len(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def key(self, sequence, motif_set=None):
+        """
+        Return the cache key for a sequence.
+
+        Args:
+            sequence (str): Protein sequence
+            motif_set (MotifSet): Motifs searched for, if any
+
+        Returns:
+            str: Hex digest identifying the sequence and analysis settings
+        """
+        settings = f"v{METRICS_VERSION}"
+        if motif_set is not None:
+            settings += f"|motifs={','.join(motif_set.motifs)}|overlapping={motif_set.overlapping}"
+        digest = hashlib.sha256(settings.encode())
+        digest.update(b'\0')
+        digest.update(sequence.encode())
+        return digest.hexdigest()
+
+    def get_many(self, keys):
+        """
+        Look up several keys at once and mark the found ones as recently used.
+
+        Args:
+            keys (iterable): Cache keys
+
+        Returns:
+            dict: Key -> cached result for the keys that were found
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        for i in range(0, len(keys), _QUERY_BATCH):
+            batch = keys[i:i + _QUERY_BATCH]
+            placeholders = ','.join('?' * len(batch))
+            rows = self._db.execute(
+                f"SELECT key, value FROM results WHERE key IN ({placeholders})", batch)
+            for key, value in rows:
+                found[key] = json.loads(value)
+            self._db.execute(
+                f"UPDATE results SET last_used = ? WHERE key IN ({placeholders})",
+                [time.time_ns()] + batch)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, results):
+        """
+        Store newly computed results, evicting if the cache outgrew max_entries.
+
+        Args:
+            results (dict): Key -> analysis result (JSON-serializable)
+        """
+        now = time.time_ns()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+            ((key, json.dumps(value), now) for key, value in results.items()))
+        self._count += len(results)
+        if self._count > self.max_entries * (1 + EVICT_SLACK):
+            self.evict()
+        self._db.commit()
+
+    def evict(self):
+        """Delete the least recently used results beyond max_entries."""
+        self._count = len(self)
+        excess = self._count - self.max_entries
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM results WHERE key IN "
+                "(SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+            self._count = self.max_entries
+
+    def summary(self):
+        """Return a one-line description of cache hits and misses."""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return f"Cache: {self.hits} hit(s), {self.misses} miss(es) ({rate:.1f}% hit rate)"
+
+    def close(self):
+        """Evict down to max_entries, commit and close the database."""
+        self.evict()
+        self._db.commit()
+        self._db.close()
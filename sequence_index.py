@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Suffix-Array Sequence Index
+Index a whole sequence database once, then answer motif queries by binary
+search instead of rescanning every sequence.
+"""
+
+import sys
+
+import numpy as np
+
+from read_fasta import iter_fasta
+
+# Byte placed between sequences in the concatenated text; never a residue
+SEPARATOR = 0
+
+
+def _suffix_array(text):
+    """
+    Build a suffix array by prefix doubling.
+
+    Args:
+        text (np.ndarray): uint8 codes of the concatenated sequences
+
+    Returns:
+        tuple: (sa, ranks) where sa is the suffix array and ranks[j] holds the
+            rank of every suffix by its first 2**j characters; the last
+            level has a distinct rank per suffix
+    """
+    n = len(text)
+    # Dense ranks (0..n-1) keep rank * (n + 1) + next_rank collision-free
+    rank = np.unique(text, return_inverse=True)[1].astype(np.int64).reshape(-1)
+    ranks = [rank.astype(np.int32)]
+    sa = np.argsort(rank, kind='stable')
+    k = 1
+    while n > 1:
+        # Sort by (rank of first k chars, rank of next k chars); -1 past the end
+        second = np.full(n, -1, dtype=np.int64)
+        second[:n - k] = rank[k:]
+        key = rank * (n + 1) + (second + 1)
+        sa = np.argsort(key, kind='stable')
+        sorted_key = key[sa]
+        new_rank = np.empty(n, dtype=np.int64)
+        new_rank[sa] = np.concatenate(([0], np.cumsum(sorted_key[1:] != sorted_key[:-1])))
+        rank = new_rank
+        ranks.append(rank.astype(np.int32))
+        if rank[sa[-1]] == n - 1:
+            break
+        k *= 2
+    return sa, ranks
+
+
+def _lcp_array(sa, ranks):
+    """
+    Longest common prefix of each suffix with the one before it in sa.
+
+    Uses the per-level ranks from prefix doubling: two suffixes share their
+    first 2**j characters exactly when their level-j ranks are equal, so the
+    LCP of all adjacent pairs is found by binary lifting in vectorized steps.
+    """
+    n = len(sa)
+    lcp = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return lcp
+    left = sa[:-1].astype(np.int64)
+    right = sa[1:].astype(np.int64)
+    length = np.zeros(n - 1, dtype=np.int64)
+    for level in range(len(ranks) - 1, -1, -1):
+        step = 1 << level
+        rank = ranks[level]
+        a = left + length
+        b = right + length
+        valid = (a < n) & (b < n)
+        same = np.zeros(n - 1, dtype=bool)
+        same[valid] = rank[a[valid]] == rank[b[valid]]
+        length[same] += step
+    lcp[1:] = length
+    return lcp
+
+
+class SequenceIndex:
+    """
+    Suffix array (with LCP array) over a set of sequences.
+
+    All sequences are concatenated with a separator byte and every suffix
+    is sorted once, so finding all occurrences of a motif costs
+    O(len(motif) * log(N)) plus the number of hits.
+
+    Example:
+        >>> index = SequenceIndex({"p1": "ACDEFAC", "p2": "GAC"})
+        >>> index.find("AC")
+        [('p1', 0), ('p1', 5), ('p2', 1)]
+    """
+
+    def __init__(self, sequences):
+        """
+        Build the index.
+
+        Args:
+            sequences (dict or iterable): Header -> sequence dictionary or
+                (header, sequence) pairs, e.g. from read_fasta()
+        """
+        records = sequences.items() if hasattr(sequences, 'items') else sequences
+        headers = []
+        parts = []
+        offsets = [0]
+        for header, sequence in records:
+            headers.append(header)
+            parts.append(sequence.encode() + bytes([SEPARATOR]))
+            offsets.append(offsets[-1] + len(parts[-1]))
+
+        self.headers = headers
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.text = np.frombuffer(b''.join(parts), dtype=np.uint8)
+        self.sa, ranks = _suffix_array(self.text)
+        self.lcp = _lcp_array(self.sa, ranks)
+        self._text_bytes = self.text.tobytes()
+
+    @classmethod
+    def from_fasta(cls, filename):
+        """Build an index over every record of a FASTA file."""
+        return cls(iter_fasta(filename))
+
+    def __len__(self):
+        return len(self.headers)
+
+    def save(self, filename):
+        """
+        Save the index to a .npz file.
+
+        Args:
+            filename (str): Output path
+        """
+        np.savez(filename, headers=np.array(self.headers, dtype=str), offsets=self.offsets,
+                 text=self.text, sa=self.sa, lcp=self.lcp)
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load an index written by save().
+
+        Args:
+            filename (str): Path to .npz file
+
+        Returns:
+            SequenceIndex: The loaded index, ready to query
+        """
+        index = cls.__new__(cls)
+        with np.load(filename) as data:
+            index.headers = data['headers'].tolist()
+            index.offsets = data['offsets']
+            index.text = data['text']
+            index.sa = data['sa']
+            index.lcp = data['lcp']
+        index._text_bytes = index.text.tobytes()
+        return index
+
+    def _bound(self, motif, upper):
+        """Binary search for the first suffix whose prefix is >= (or > if upper) motif."""
+        text = self._text_bytes
+        sa = self.sa
+        m = len(motif)
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = sa[mid]
+            prefix = text[start:start + m]
+            if prefix < motif or (upper and prefix == motif):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, motif):
+        """
+        Find all occurrences of a motif across the indexed sequences.
+
+        Args:
+            motif (str): Motif to search for
+
+        Returns:
+            list: (header, position) pairs with 0-indexed positions, sorted by
+                sequence order then position
+        """
+        if not motif:
+            raise ValueError("Motif must not be empty")
+        key = motif.encode()
+        lo = self._bound(key, upper=False)
+        hi = self._bound(key, upper=True)
+        starts = np.sort(self.sa[lo:hi])
+        records = np.searchsorted(self.offsets, starts, side='right') - 1
+        positions = starts - self.offsets[records]
+        return [(self.headers[record], int(position))
+                for record, position in zip(records.tolist(), positions.tolist())]
+
+    def count(self, motif):
+        """Return the number of occurrences of a motif."""
+        key = motif.encode()
+        return self._bound(key, upper=True) - self._bound(key, upper=False)
+
+
+# Test your functions
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python sequence_index.py <fasta_file> <motif> [motif ...]")
+        print("Example: python sequence_index.py sample.fasta LV GK")
+        sys.exit(1)
+
+    index = SequenceIndex.from_fasta(sys.argv[1])
+    for motif in sys.argv[2:]:
+        hits = index.find(motif)
+        print(f"{motif}: {len(hits)} hit(s)")
+        for header, position in hits:
+            print(f"  {header}\t{position}")
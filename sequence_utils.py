@@ -4,10 +4,123 @@ HW3 Part 2: Sequence Utilities
 Implement functions for analyzing protein sequences.
 """
 
+import numpy as np
+
+# Average molecular weights of amino acids (in Daltons)
+AA_WEIGHTS = {
+    'A': 89.09, 'R': 174.20, 'N': 132.12, 'D': 133.10, 'C': 121.15,
+    'Q': 146.15, 'E': 147.13, 'G': 75.07, 'H': 155.16, 'I': 131.17,
+    'L': 131.17, 'K': 146.19, 'M': 149.21, 'F': 165.19, 'P': 115.13,
+    'S': 105.09, 'T': 119.12, 'W': 204.23, 'Y': 181.19, 'V': 117.15
+}
+HYDROPHOBIC = 'AVILMFWP'
+# Kyte-Doolittle hydropathy index (Kyte & Doolittle, 1982)
+KYTE_DOOLITTLE = {
+    'A': 1.8, 'R': -4.5, 'N': -3.5, 'D': -3.5, 'C': 2.5,
+    'Q': -3.5, 'E': -3.5, 'G': -0.4, 'H': -3.2, 'I': 4.5,
+    'L': 3.8, 'K': -3.9, 'M': 1.9, 'F': 2.8, 'P': -1.6,
+    'S': -0.8, 'T': -0.7, 'W': -0.9, 'Y': -1.3, 'V': 4.2
+}
+POSITIVE = 'KRH'
+NEGATIVE = 'DE'
+BACKENDS = ('python', 'numpy')
+# pKa values of the ionizable groups: the termini plus K, R, H (basic) and
+# D, E, C, Y (acidic) side chains
+PKA_SETS = {
+    'emboss': {'N_term': 8.6, 'K': 10.8, 'R': 12.5, 'H': 6.5,
+               'C_term': 3.6, 'D': 3.9, 'E': 4.1, 'C': 8.5, 'Y': 10.1},
+    'lehninger': {'N_term': 9.69, 'K': 10.5, 'R': 12.4, 'H': 6.0,
+                  'C_term': 2.34, 'D': 3.86, 'E': 4.25, 'C': 8.33, 'Y': 10.0},
+    'solomon': {'N_term': 9.6, 'K': 10.5, 'R': 12.5, 'H': 6.0,
+                'C_term': 2.4, 'D': 3.9, 'E': 4.3, 'C': 8.3, 'Y': 10.1},
+}
+# Bisection stops once the pI bracket is narrower than this
+PI_TOLERANCE = 1e-4
+# Bump whenever a metric's definition changes, so cached results are recomputed
+METRICS_VERSION = 1
+# Below this length sequence_metrics() counts in pure Python, which beats
+# the fixed cost of a NumPy encode and bincount per call
+SHORT_SEQUENCE_LENGTH = 64
+# Residues counted per bincount by sequence_metrics_many(), which bounds its
+# temporary index arrays; longer sequences go through sequence_metrics()
+METRICS_BATCH_RESIDUES = 1 << 20
+
+
+def _byte_lookup(symbols, values=None):
+    """Build a 256-entry table indexed by byte value for the given symbols."""
+    table = np.zeros(256, dtype=np.float64 if values else bool)
+    for i, symbol in enumerate(symbols):
+        table[ord(symbol)] = values[i] if values else True
+    return table
+
+
+_WEIGHT_LUT = _byte_lookup(AA_WEIGHTS, list(AA_WEIGHTS.values()))
+_KNOWN_LUT = _byte_lookup(AA_WEIGHTS)
+_HYDROPHOBIC_LUT = _byte_lookup(HYDROPHOBIC)
+_POSITIVE_LUT = _byte_lookup(POSITIVE)
+_NEGATIVE_LUT = _byte_lookup(NEGATIVE)
+_HYDROPHOBIC_SET = frozenset(HYDROPHOBIC)
+_POSITIVE_SET = frozenset(POSITIVE)
+_NEGATIVE_SET = frozenset(NEGATIVE)
+_KYTE_DOOLITTLE_LUT = _byte_lookup(KYTE_DOOLITTLE, list(KYTE_DOOLITTLE.values()))
+
+# One column per derived metric, so a single histogram @ matrix product
+# yields weight, hydrophobic, positive, negative and unknown counts at once.
+_METRIC_MATRIX = np.stack([_WEIGHT_LUT, _HYDROPHOBIC_LUT, _POSITIVE_LUT,
+                           _NEGATIVE_LUT, ~_KNOWN_LUT], axis=1).astype(np.float64)
+
+# The same matrix restricted to the 20 standard residues (in byte order,
+# so sums run in the same order) plus one "unknown" column, for batches
+_STANDARD_CODES = np.array(sorted(ord(aa) for aa in AA_WEIGHTS))
+_STANDARD_COLUMNS = np.full(256, len(_STANDARD_CODES), dtype=np.int32)
+_STANDARD_COLUMNS[_STANDARD_CODES] = np.arange(len(_STANDARD_CODES))
+_STANDARD_METRIC_MATRIX = np.vstack([_METRIC_MATRIX[_STANDARD_CODES], [0, 0, 0, 0, 1]])
+
+
+def _check_backend(backend):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend!r} (expected one of {BACKENDS})")
+
+
+def _residue_histogram(protein_seq):
+    """
+    Convert a sequence to uint8 codes once and count every byte value.
+
+    Args:
+        protein_seq (str): Protein sequence
+
+    Returns:
+        tuple: (codes, counts) where codes is a uint8 array of the sequence
+            (non-ASCII characters become '?', keeping one code per residue)
+            and counts is a 256-entry array of occurrences per byte value
+    """
+    codes = np.frombuffer(protein_seq.encode('ascii', 'replace'), dtype=np.uint8)
+    return codes, np.bincount(codes, minlength=256)
+
+
+def _raise_unknown(protein_seq, codes):
+    first_unknown = np.flatnonzero(~_KNOWN_LUT[codes])[0]
+    raise ValueError(f"Unknown amino acid: {protein_seq[first_unknown]}")
+
+
+def _finish_weight(residue_weight, length):
+    """Apply the water-loss correction and rounding used by molecular_weight()."""
+    if length > 1:
+        residue_weight -= 18.01 * (length - 1)
+    return round(residue_weight, 2)
+
+
+def _weight_from_histogram(protein_seq, codes, counts):
+    """Molecular weight from a byte histogram, with the same rules as the loop."""
+    if counts[~_KNOWN_LUT].any():
+        _raise_unknown(protein_seq, codes)
+    return _finish_weight(float(counts @ _WEIGHT_LUT), len(protein_seq))
+
+
 # Exercise 1: Calculate Molecular Weight
 # TODO: Implement a function to calculate the approximate molecular weight of a protein
 # Use the average molecular weights for amino acids
-def molecular_weight(protein_seq):
+def molecular_weight(protein_seq, backend="python"):
     """
     Calculate the approximate molecular weight of a protein sequence.
 
@@ -15,6 +128,8 @@ def molecular_weight(protein_seq):
 
     Args:
         protein_seq (str): Protein sequence (single letter codes)
+        backend (str): "python" for a per-residue loop, "numpy" for a
+            vectorized lookup-table sum; both return the same value
 
     Returns:
         float: Molecular weight in Daltons (Da)
@@ -23,21 +138,17 @@ def molecular_weight(protein_seq):
         >>> molecular_weight("AAA")
         231.27
     """
-    # Average molecular weights of amino acids (in Daltons)
-    aa_weights = {
-        'A': 89.09, 'R': 174.20, 'N': 132.12, 'D': 133.10, 'C': 121.15,
-        'Q': 146.15, 'E': 147.13, 'G': 75.07, 'H': 155.16, 'I': 131.17,
-        'L': 131.17, 'K': 146.19, 'M': 149.21, 'F': 165.19, 'P': 115.13,
-        'S': 105.09, 'T': 119.12, 'W': 204.23, 'Y': 181.19, 'V': 117.15
-    }
+    _check_backend(backend)
+    if backend == "numpy":
+        return _weight_from_histogram(protein_seq, *_residue_histogram(protein_seq))
 
     # TODO: Implement this function
     # Hint: Loop through the sequence and sum up the weights
     # Hint: Subtract 18.01 for each peptide bond (number of residues - 1) to account for water loss
     weight = 0.0
     for aa in protein_seq:
-        if aa in aa_weights:
-            weight += aa_weights[aa]
+        if aa in AA_WEIGHTS:
+            weight += AA_WEIGHTS[aa]
         else:
             raise ValueError(f"Unknown amino acid: {aa}")
 
@@ -50,7 +161,7 @@ def molecular_weight(protein_seq):
 
 # Exercise 2: Count Hydrophobic Residues
 # TODO: Write a function to count hydrophobic amino acids in a sequence
-def count_hydrophobic(protein_seq):
+def count_hydrophobic(protein_seq, backend="python"):
     """
     Count the number of hydrophobic amino acids in a protein sequence.
 
@@ -58,6 +169,7 @@ def count_hydrophobic(protein_seq):
 
     Args:
         protein_seq (str): Protein sequence
+        backend (str): "python" or "numpy"
 
     Returns:
         int: Number of hydrophobic residues
@@ -66,7 +178,12 @@ def count_hydrophobic(protein_seq):
         >>> count_hydrophobic("AVLMFWP")
         7
     """
-    hydrophobic = set('AVILMFWP')
+    _check_backend(backend)
+    if backend == "numpy":
+        _, counts = _residue_histogram(protein_seq)
+        return int(counts[_HYDROPHOBIC_LUT].sum())
+
+    hydrophobic = set(HYDROPHOBIC)
 
     # TODO: Implement this function
     # Hint: Use a for loop or sum() with a generator expression
@@ -104,7 +221,7 @@ def find_motif(seq, motif):
 
 # Exercise 4: Calculate Isoelectric Point (Simplified)
 # TODO: Implement a simplified function to estimate the isoelectric point
-def count_charged_residues(protein_seq):
+def count_charged_residues(protein_seq, backend="python"):
     """
     Count positively and negatively charged amino acids.
 
@@ -113,6 +230,7 @@ def count_charged_residues(protein_seq):
 
     Args:
         protein_seq (str): Protein sequence
+        backend (str): "python" or "numpy"
 
     Returns:
         tuple: (positive_count, negative_count)
@@ -121,8 +239,13 @@ def count_charged_residues(protein_seq):
         >>> count_charged_residues("KRHDE")
         (3, 2)
     """
-    positive = set('KRH')
-    negative = set('DE')
+    _check_backend(backend)
+    if backend == "numpy":
+        _, counts = _residue_histogram(protein_seq)
+        return (int(counts[_POSITIVE_LUT].sum()), int(counts[_NEGATIVE_LUT].sum()))
+
+    positive = set(POSITIVE)
+    negative = set(NEGATIVE)
 
     # TODO: Implement this function
     # Return a tuple of (number of positive, number of negative)
@@ -138,6 +261,440 @@ def count_charged_residues(protein_seq):
     return (pos_count, neg_count)
 
 
+# Combined Metrics
+def amino_acid_counts(protein_seq):
+    """
+    Count each of the 20 standard amino acids in a single pass.
+
+    Args:
+        protein_seq (str): Protein sequence
+
+    Returns:
+        dict: Amino acid -> count for all 20 standard residues (zeros included)
+
+    Example:
+        >>> amino_acid_counts("AAC")['A']
+        2
+    """
+    _, counts = _residue_histogram(protein_seq)
+    return {aa: int(counts[ord(aa)]) for aa in AA_WEIGHTS}
+
+
+def sequence_metrics(protein_seq):
+    """
+    Compute every per-sequence metric from one residue histogram.
+
+    The sequence is scanned once; molecular weight, hydrophobic count and
+    charge counts are then derived from the histogram, giving the same
+    values as calling molecular_weight(), count_hydrophobic() and
+    count_charged_residues() separately.
+
+    Args:
+        protein_seq (str): Protein sequence
+
+    Returns:
+        dict: length, molecular_weight, hydrophobic_count, positive_charge
+            and negative_charge
+
+    Raises:
+        ValueError: If the sequence contains an unknown amino acid
+
+    Example:
+        >>> sequence_metrics("KRHDE")['positive_charge']
+        3
+    """
+    if len(protein_seq) < SHORT_SEQUENCE_LENGTH:
+        return _short_sequence_metrics(protein_seq)
+    codes, counts = _residue_histogram(protein_seq)
+    metrics, unknown = _metrics_from_histogram(counts, len(protein_seq))
+    if unknown:
+        _raise_unknown(protein_seq, codes)
+    return metrics
+
+
+def _short_sequence_metrics(protein_seq):
+    """sequence_metrics() for short sequences: one pure-Python pass, no NumPy."""
+    weight = 0.0
+    hydrophobic = positive = negative = 0
+    for aa in protein_seq:
+        if aa not in AA_WEIGHTS:
+            raise ValueError(f"Unknown amino acid: {aa}")
+        weight += AA_WEIGHTS[aa]
+        if aa in _HYDROPHOBIC_SET:
+            hydrophobic += 1
+        elif aa in _POSITIVE_SET:
+            positive += 1
+        elif aa in _NEGATIVE_SET:
+            negative += 1
+    return {
+        'length': len(protein_seq),
+        'molecular_weight': _finish_weight(weight, len(protein_seq)),
+        'hydrophobic_count': hydrophobic,
+        'positive_charge': positive,
+        'negative_charge': negative
+    }
+
+
+def sequence_metrics_many(protein_seqs):
+    """
+    Compute sequence_metrics() for many sequences with a few NumPy passes.
+
+    Sequences are grouped into batches of up to METRICS_BATCH_RESIDUES
+    residues, and each batch is counted with a single bincount of
+    (sequence, residue) pairs, so the per-call NumPy overhead that makes
+    sequence_metrics() slow on short peptides is paid once per batch.
+    Sequences of METRICS_BATCH_RESIDUES or more go through
+    sequence_metrics() itself, so temporary memory stays bounded by the
+    batch size rather than growing with the longest record.
+
+    Args:
+        protein_seqs (list): Protein sequences
+
+    Returns:
+        list: One sequence_metrics() dictionary per sequence, in order
+
+    Raises:
+        ValueError: If a sequence contains an unknown amino acid
+    """
+    results = []
+    batch = []
+    batch_residues = 0
+    for seq in protein_seqs:
+        long_seq = len(seq) >= METRICS_BATCH_RESIDUES
+        if batch and (long_seq or batch_residues + len(seq) > METRICS_BATCH_RESIDUES):
+            results += _batch_metrics(batch)
+            batch = []
+            batch_residues = 0
+        if long_seq:
+            results.append(sequence_metrics(seq))
+        else:
+            batch.append(seq)
+            batch_residues += len(seq)
+    if batch:
+        results += _batch_metrics(batch)
+    return results
+
+
+def _batch_metrics(protein_seqs):
+    """sequence_metrics_many() for one batch, with int32 bincount indices."""
+    # 'replace' keeps one byte per character, so str lengths stay valid offsets
+    codes = np.frombuffer(''.join(protein_seqs).encode('ascii', 'replace'), dtype=np.uint8)
+    lengths = np.fromiter(map(len, protein_seqs), dtype=np.int64, count=len(protein_seqs))
+    width = len(_STANDARD_METRIC_MATRIX)
+    columns = _STANDARD_COLUMNS[codes]
+    columns += np.repeat(np.arange(len(protein_seqs), dtype=np.int32) * width, lengths)
+    counts = np.bincount(columns, minlength=len(protein_seqs) * width).reshape(-1, width)
+    totals = counts @ _STANDARD_METRIC_MATRIX
+    if totals[:, 4].any():
+        seq = protein_seqs[int(np.flatnonzero(totals[:, 4])[0])]
+        raise ValueError(f"Unknown amino acid: {next(a for a in seq if a not in AA_WEIGHTS)}")
+
+    # Water-loss correction as in molecular_weight(); round() per value
+    # below keeps its exact rounding
+    weights = totals[:, 0] - 18.01 * np.maximum(lengths - 1, 0)
+    return [{
+        'length': length,
+        'molecular_weight': round(weight, 2),
+        'hydrophobic_count': hydrophobic,
+        'positive_charge': positive,
+        'negative_charge': negative
+    } for length, weight, hydrophobic, positive, negative in zip(
+        lengths.tolist(), weights.tolist(), *totals[:, 1:4].astype(np.int64).T.tolist())]
+
+
+def _metrics_from_histogram(counts, length):
+    """
+    Derive the sequence_metrics() values from a 256-entry byte histogram.
+
+    Returns:
+        tuple: (metrics, unknown) where unknown is the number of residues
+            without a known weight; metrics are only valid if it is zero
+    """
+    weight, hydrophobic, positive, negative, unknown = (counts @ _METRIC_MATRIX).tolist()
+    metrics = {
+        'length': length,
+        'molecular_weight': _finish_weight(weight, length),
+        'hydrophobic_count': int(hydrophobic),
+        'positive_charge': int(positive),
+        'negative_charge': int(negative)
+    }
+    return metrics, unknown
+
+
+# Sliding-Window Profiles
+def window_sums(values, window):
+    """
+    Sum every window of `window` consecutive values in O(n) with a prefix sum.
+
+    Args:
+        values (np.ndarray): Per-residue values
+        window (int): Window length
+
+    Returns:
+        np.ndarray: len(values) - window + 1 sums (empty if the input is
+            shorter than the window); window i covers values[i:i + window]
+    """
+    if window < 1:
+        raise ValueError(f"Window must be at least 1, got {window}")
+    prefix = np.zeros(len(values) + 1, dtype=np.int64 if values.dtype == bool else np.float64)
+    np.cumsum(values, out=prefix[1:])
+    return prefix[window:] - prefix[:-window] if window <= len(values) else prefix[:0]
+
+
+def hydrophobic_window_counts(protein_seq, window=19):
+    """
+    Count hydrophobic residues in every window of a sequence.
+
+    Gives the same values as count_hydrophobic(protein_seq[i:i + window])
+    for each i, without slicing out each window.
+
+    Args:
+        protein_seq (str): Protein sequence
+        window (int): Window length
+
+    Returns:
+        np.ndarray: int64 count per window start
+
+    Example:
+        >>> hydrophobic_window_counts("AAGGA", window=2).tolist()
+        [2, 1, 0, 1]
+    """
+    codes, _ = _residue_histogram(protein_seq)
+    return window_sums(_HYDROPHOBIC_LUT[codes], window)
+
+
+def hydropathy_profile(protein_seq, window=19):
+    """
+    Compute the Kyte-Doolittle hydropathy profile of a sequence.
+
+    Windows averaging above about 1.6 with a length of 19 are the usual
+    signal for a transmembrane helix.
+
+    Args:
+        protein_seq (str): Protein sequence
+        window (int): Window length, typically 9 to 21
+
+    Returns:
+        np.ndarray: Average hydropathy per window start
+
+    Raises:
+        ValueError: If the sequence contains an unknown amino acid
+
+    Example:
+        >>> hydropathy_profile("IIVV", window=2).round(2).tolist()
+        [4.5, 4.35, 4.2]
+    """
+    codes, counts = _residue_histogram(protein_seq)
+    if counts[~_KNOWN_LUT].any():
+        _raise_unknown(protein_seq, codes)
+    return window_sums(_KYTE_DOOLITTLE_LUT[codes], window) / window
+
+
+def hydropathy_profiles(sequences, window=19, metric="hydropathy"):
+    """
+    Compute a windowed profile for every sequence of a collection.
+
+    The records are concatenated and scanned with one prefix sum per block,
+    so the cost is linear in the total number of residues.
+
+    Args:
+        sequences: A FASTA path, a SequenceCollection, a dict of
+            header -> sequence or an iterable of (header, sequence) pairs
+        window (int): Window length
+        metric (str): "hydropathy" for Kyte-Doolittle averages or
+            "hydrophobic" for hydrophobic residue counts
+
+    Returns:
+        dict: header -> profile array, as hydropathy_profile() or
+            hydrophobic_window_counts() would return for that sequence
+
+    Raises:
+        ValueError: For an unknown amino acid when metric is "hydropathy"
+    """
+    from sequence_collection import as_collection
+
+    if metric not in ("hydropathy", "hydrophobic"):
+        raise ValueError(f"Unknown metric: {metric!r} (expected hydropathy or hydrophobic)")
+    collection = as_collection(sequences)
+
+    if metric == "hydrophobic":
+        profiles = collection.window_sums(_HYDROPHOBIC_LUT, window)
+    else:
+        unknown = ~_KNOWN_LUT[collection.residues[collection.offsets[0]:collection.offsets[-1]]]
+        if unknown.any():
+            code = collection.residues[collection.offsets[0] + np.flatnonzero(unknown)[0]]
+            raise ValueError(f"Unknown amino acid: {chr(code)}")
+        profiles = [sums / window for sums in collection.window_sums(_KYTE_DOOLITTLE_LUT, window)]
+    return dict(zip(collection.keys(), profiles))
+
+
+# Isoelectric Point
+_IONIZABLE_GROUPS = ('N_term', 'K', 'R', 'H', 'C_term', 'D', 'E', 'C', 'Y')
+_IONIZABLE_RESIDUES = 'KRHDECY'
+# +1 for groups that are positive when protonated, -1 for the acidic ones
+_GROUP_SIGNS = np.array([1, 1, 1, 1, -1, -1, -1, -1, -1], dtype=np.float64)
+
+
+def _pka_vector(pka):
+    """Resolve a pKa set name or dictionary to an array in _IONIZABLE_GROUPS order."""
+    if isinstance(pka, str):
+        if pka not in PKA_SETS:
+            raise ValueError(f"Unknown pKa set: {pka!r} (expected one of {tuple(PKA_SETS)})")
+        pka = PKA_SETS[pka]
+    missing = set(_IONIZABLE_GROUPS) - set(pka)
+    if missing:
+        raise ValueError(f"pKa set is missing: {', '.join(sorted(missing))}")
+    return np.array([pka[group] for group in _IONIZABLE_GROUPS], dtype=np.float64)
+
+
+def _group_counts(residue_counts, lengths):
+    """
+    Build the N x 9 ionizable group matrix from K, R, H, D, E, C, Y counts.
+
+    Every non-empty sequence contributes one N- and one C-terminus.
+    """
+    residue_counts = np.asarray(residue_counts, dtype=np.float64).reshape(-1, 7)
+    termini = (np.asarray(lengths).reshape(-1) > 0).astype(np.float64)
+    return np.column_stack([termini, residue_counts[:, :3], termini, residue_counts[:, 3:]])
+
+
+def _charge_fractions(ph, pka):
+    """
+    Henderson-Hasselbalch charge of one group at each pH.
+
+    Args:
+        ph (np.ndarray): pH values, broadcastable against pka
+        pka (np.ndarray): pKa values in _IONIZABLE_GROUPS order (last axis)
+
+    Returns:
+        np.ndarray: Charge per group, between 0 and +1 for basic groups and
+            between -1 and 0 for acidic ones
+    """
+    return _GROUP_SIGNS / (1.0 + 10.0 ** (_GROUP_SIGNS * (ph - pka)))
+
+
+def _solve_isoelectric_points(groups, pka, tolerance):
+    """Bisect the pH of zero net charge for every row of a group matrix at once."""
+    low = np.zeros(len(groups))
+    high = np.full(len(groups), 14.0)
+    while (high - low).max(initial=0.0) > tolerance:
+        middle = (low + high) / 2
+        charge = (groups * _charge_fractions(middle[:, None], pka)).sum(axis=1)
+        # Net charge falls as pH rises, so a positive charge means pI is higher
+        positive = charge > 0
+        low = np.where(positive, middle, low)
+        high = np.where(positive, high, middle)
+    points = (low + high) / 2
+    points[~groups.any(axis=1)] = np.nan  # empty sequences have no pI
+    return points
+
+
+def _single_sequence_groups(protein_seq):
+    _, counts = _residue_histogram(protein_seq)
+    return _group_counts([counts[ord(aa)] for aa in _IONIZABLE_RESIDUES], len(protein_seq))
+
+
+def net_charge(protein_seq, ph=7.0, pka="emboss"):
+    """
+    Calculate the net charge of a protein at a given pH.
+
+    Each ionizable group (termini and K, R, H, D, E, C, Y side chains)
+    contributes its Henderson-Hasselbalch charge; unlike
+    count_charged_residues() this accounts for partial protonation.
+
+    Args:
+        protein_seq (str): Protein sequence
+        ph (float): pH of the solution
+        pka (str or dict): Name of a set in PKA_SETS, or a dict with a pKa
+            for every group ('N_term', 'C_term', 'K', 'R', 'H', 'D', 'E',
+            'C', 'Y')
+
+    Returns:
+        float: Net charge
+
+    Example:
+        >>> round(net_charge("KKDE", ph=7.0), 2)
+        -0.02
+    """
+    groups = _single_sequence_groups(protein_seq)
+    return float((groups * _charge_fractions(ph, _pka_vector(pka))).sum())
+
+
+def isoelectric_point(protein_seq, pka="emboss", tolerance=PI_TOLERANCE):
+    """
+    Estimate the isoelectric point (pI) of a protein.
+
+    The pI is the pH at which net_charge() is zero, found by bisection on
+    pH 0-14.
+
+    Args:
+        protein_seq (str): Protein sequence
+        pka (str or dict): pKa set, as net_charge()
+        tolerance (float): Width of the final pH bracket
+
+    Returns:
+        float: Isoelectric point (nan for an empty sequence)
+
+    Example:
+        >>> round(isoelectric_point("KKKK"), 1)
+        11.3
+    """
+    groups = _single_sequence_groups(protein_seq)
+    return float(_solve_isoelectric_points(groups, _pka_vector(pka), tolerance)[0])
+
+
+def _collection_groups(sequences):
+    from sequence_collection import as_collection
+
+    collection = as_collection(sequences)
+    groups = _group_counts(collection.residue_counts(_IONIZABLE_RESIDUES), collection.lengths())
+    return collection, groups
+
+
+def charge_curves(sequences, ph_values=np.arange(0.0, 14.01, 0.5), pka="emboss"):
+    """
+    Evaluate the net charge of many sequences over a grid of pH values.
+
+    The sequences are reduced to an N x 9 matrix of ionizable group counts,
+    so every curve comes from a single matrix product with the 9 x P
+    matrix of per-group charges.
+
+    Args:
+        sequences: A FASTA path, a SequenceCollection, a dict of
+            header -> sequence or an iterable of (header, sequence) pairs
+        ph_values (array-like): The P pH values to evaluate
+        pka (str or dict): pKa set, as net_charge()
+
+    Returns:
+        tuple: (matrix, headers) where matrix[i, j] is the net charge of
+            sequence headers[i] at ph_values[j]
+    """
+    collection, groups = _collection_groups(sequences)
+    ph = np.asarray(ph_values, dtype=np.float64)
+    fractions = _charge_fractions(ph[:, None], _pka_vector(pka)).T
+    return groups @ fractions, list(collection.keys())
+
+
+def isoelectric_points(sequences, pka="emboss", tolerance=PI_TOLERANCE):
+    """
+    Compute the isoelectric point of many sequences at once.
+
+    All sequences are bisected together, one vectorized charge evaluation
+    per step, giving the same values as isoelectric_point().
+
+    Args:
+        sequences: A FASTA path, a SequenceCollection, a dict of
+            header -> sequence or an iterable of (header, sequence) pairs
+        pka (str or dict): pKa set, as net_charge()
+        tolerance (float): Width of the final pH bracket
+
+    Returns:
+        tuple: (points, headers) where points[i] is the pI of headers[i]
+    """
+    collection, groups = _collection_groups(sequences)
+    return _solve_isoelectric_points(groups, _pka_vector(pka), tolerance), list(collection.keys())
+
+
 # Test your functions
 if __name__ == "__main__":
     print("Testing Sequence Utility Functions")